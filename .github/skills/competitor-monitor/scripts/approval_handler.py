@@ -4,11 +4,21 @@ Handles user-in-the-loop approval for autonomous actions.
 Validates: Requirements 7.1, 7.2, 7.3, 7.4, 7.5
 """
 
+import asyncio
+import heapq
+import itertools
 import json
+import time
+from collections import deque
 from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class ApprovalStatus(Enum):
     """Status of an approval request."""
@@ -21,6 +31,20 @@ class ApprovalStatus(Enum):
 class ApprovalRequest:
     """Represents an approval request."""
     
+    __slots__ = (
+        'action_type',
+        '_description',
+        'action_data',
+        'timeout_seconds',
+        'status',
+        'requested_at',
+        'approved_at',
+        'rejected_at',
+        'approver',
+        '_requested_monotonic',
+        '_cached_dict',
+    )
+    
     def __init__(self, action_type: str, description: str, 
                  action_data: dict, timeout_seconds: int = 300):
         """
@@ -33,15 +57,27 @@ class ApprovalRequest:
             timeout_seconds: Timeout in seconds (default 5 minutes)
         """
         self.action_type = action_type
-        self.description = description
+        self._description = description
         self.action_data = action_data
         self.timeout_seconds = timeout_seconds
         self.status = ApprovalStatus.PENDING
         self.requested_at = datetime.now()
+        # Monotonic clock for expiry checks; requested_at is kept for serialization
+        self._requested_monotonic = time.monotonic()
+        self._cached_dict: Optional[dict] = None
         self.approved_at: Optional[datetime] = None
         self.rejected_at: Optional[datetime] = None
         self.approver: Optional[str] = None
     
+    @property
+    def description(self) -> str:
+        """Human-readable description of the action."""
+        return self._description
+    
+    @description.setter
+    def description(self, value: str) -> None:
+        self._description = value
+    
     def approve(self, approver: str = 'user') -> bool:
         """Approve the request."""
         if self.status != ApprovalStatus.PENDING:
@@ -67,12 +103,21 @@ class ApprovalRequest:
         if self.status != ApprovalStatus.PENDING:
             return False
         
-        elapsed = (datetime.now() - self.requested_at).total_seconds()
-        return elapsed > self.timeout_seconds
+        return (time.monotonic() - self._requested_monotonic) > self.timeout_seconds
+    
+    def time_remaining(self) -> float:
+        """Get the number of seconds left before the request expires."""
+        elapsed = time.monotonic() - self._requested_monotonic
+        return max(self.timeout_seconds - elapsed, 0.0)
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return {
+        # Settled requests never change, so their dictionary is built once;
+        # callers get a copy so they cannot alter the cached one
+        if self._cached_dict is not None:
+            return dict(self._cached_dict)
+        
+        result = {
             'action_type': self.action_type,
             'description': self.description,
             'action_data': self.action_data,
@@ -82,47 +127,135 @@ class ApprovalRequest:
             'rejected_at': self.rejected_at.isoformat() if self.rejected_at else None,
             'approver': self.approver,
         }
+        
+        if self.status != ApprovalStatus.PENDING:
+            self._cached_dict = dict(result)
+        return result
     
     def to_json(self) -> str:
         """Convert to JSON string."""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode()
         return json.dumps(self.to_dict(), indent=2)
 
 
+class TerminalApprovalRequest(ApprovalRequest):
+    """Approval request for a terminal command."""
+    
+    __slots__ = ()
+    
+    def __init__(self, command: str, timeout_seconds: int = 300):
+        """
+        Initialize a terminal command approval request.
+        
+        Args:
+            command: The terminal command to execute
+            timeout_seconds: Timeout in seconds (default 5 minutes)
+        """
+        super().__init__(
+            action_type='terminal',
+            description=None,
+            action_data={'command': command},
+            timeout_seconds=timeout_seconds
+        )
+    
+    @property
+    def description(self) -> str:
+        """Human-readable description, formatted the first time it is read."""
+        if self._description is None:
+            command = self.action_data['command']
+            self._description = f'Execute terminal command: {command[:50]}...'
+        return self._description
+    
+    @description.setter
+    def description(self, value: str) -> None:
+        self._description = value
+
+
 class ApprovalHandler:
     """Handles user approval requests for autonomous actions."""
     
-    def __init__(self):
-        """Initialize the approval handler."""
-        self.pending_requests: list[ApprovalRequest] = []
-        self.approved_requests: list[ApprovalRequest] = []
-        self.rejected_requests: list[ApprovalRequest] = []
+    def __init__(self, history_limit: Optional[int] = 1000,
+                 default_timeout: int = 300,
+                 poll_interval: float = 0.1,
+                 max_poll_interval: float = 2.0):
+        """
+        Initialize the approval handler.
+        
+        Args:
+            history_limit: Maximum number of approved and of rejected requests
+                to keep; the oldest are dropped first (None for unbounded)
+            default_timeout: Timeout in seconds for new requests
+            poll_interval: Initial polling interval for await_approval
+            max_poll_interval: Maximum polling interval for await_approval
+        """
+        self.default_timeout = default_timeout
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        # Pending requests keyed by id(request); dict order keeps oldest first
+        self.pending_requests: dict[int, ApprovalRequest] = {}
+        self.approved_requests: deque[ApprovalRequest] = deque(maxlen=history_limit)
+        self.rejected_requests: deque[ApprovalRequest] = deque(maxlen=history_limit)
+        # Maps id(request) to 'pending', 'approved' or 'rejected'
+        self._index: dict[int, str] = {}
+        # Min-heap of (deadline, tie-breaker, request) for expiry checks
+        self._expiry_heap: list[tuple[float, int, ApprovalRequest]] = []
+        self._counter = itertools.count()
+    
+    def _add_pending(self, request: ApprovalRequest) -> None:
+        """Track a new request as pending."""
+        self.pending_requests[id(request)] = request
+        self._index[id(request)] = 'pending'
+        deadline = request._requested_monotonic + request.timeout_seconds
+        heapq.heappush(self._expiry_heap, (deadline, next(self._counter), request))
     
-    def request_terminal_approval(self, command: str) -> ApprovalRequest:
+    def _settle(self, request: ApprovalRequest, bucket: str) -> None:
+        """Move a pending request into the approved or rejected history."""
+        history = self.approved_requests if bucket == 'approved' else self.rejected_requests
+        del self.pending_requests[id(request)]
+        
+        if history.maxlen == 0:
+            # No history is kept; get_approval_status falls back to the
+            # request's own status
+            self._index.pop(id(request), None)
+            return
+        
+        # The deque drops its oldest entry when full; drop it from the index too
+        if history and len(history) == history.maxlen:
+            self._index.pop(id(history[0]), None)
+        
+        history.append(request)
+        self._index[id(request)] = bucket
+    
+    def request_terminal_approval(self, command: str,
+                                  timeout_seconds: Optional[int] = None) -> ApprovalRequest:
         """
         Request approval for a terminal command.
         
         Args:
             command: The terminal command to execute
+            timeout_seconds: Timeout override (defaults to default_timeout)
             
         Returns:
             ApprovalRequest object
         """
-        request = ApprovalRequest(
-            action_type='terminal',
-            description=f'Execute terminal command: {command[:50]}...',
-            action_data={'command': command}
+        request = TerminalApprovalRequest(
+            command,
+            timeout_seconds=self.default_timeout if timeout_seconds is None else timeout_seconds
         )
-        self.pending_requests.append(request)
+        self._add_pending(request)
         return request
     
     def request_file_approval(self, file_path: str, 
-                              action: str = 'write') -> ApprovalRequest:
+                              action: str = 'write',
+                              timeout_seconds: Optional[int] = None) -> ApprovalRequest:
         """
         Request approval for a file operation.
         
         Args:
             file_path: Path to the file
             action: Action being performed (write, delete, modify)
+            timeout_seconds: Timeout override (defaults to default_timeout)
             
         Returns:
             ApprovalRequest object
@@ -130,17 +263,20 @@ class ApprovalHandler:
         request = ApprovalRequest(
             action_type='file',
             description=f'{action} file: {file_path}',
-            action_data={'file_path': file_path, 'action': action}
+            action_data={'file_path': file_path, 'action': action},
+            timeout_seconds=self.default_timeout if timeout_seconds is None else timeout_seconds
         )
-        self.pending_requests.append(request)
+        self._add_pending(request)
         return request
     
-    def request_url_approval(self, url: str) -> ApprovalRequest:
+    def request_url_approval(self, url: str,
+                             timeout_seconds: Optional[int] = None) -> ApprovalRequest:
         """
         Request approval for URL browsing.
         
         Args:
             url: The URL to browse
+            timeout_seconds: Timeout override (defaults to default_timeout)
             
         Returns:
             ApprovalRequest object
@@ -148,32 +284,33 @@ class ApprovalHandler:
         request = ApprovalRequest(
             action_type='url',
             description=f'Browse URL: {url}',
-            action_data={'url': url}
+            action_data={'url': url},
+            timeout_seconds=self.default_timeout if timeout_seconds is None else timeout_seconds
         )
-        self.pending_requests.append(request)
+        self._add_pending(request)
         return request
     
     def get_pending_request(self) -> Optional[ApprovalRequest]:
         """Get the oldest pending request."""
         if not self.pending_requests:
+            # Anything left in the heap belongs to settled requests
+            self._expiry_heap.clear()
             return None
         
-        # Check for expired requests
-        for request in self.pending_requests:
-            if request.is_expired():
-                request.status = ApprovalStatus.EXPIRED
-                self.rejected_requests.append(request)
-        
-        # Remove expired requests from pending
-        self.pending_requests = [
-            r for r in self.pending_requests 
-            if r.status == ApprovalStatus.PENDING
-        ]
-        
-        if not self.pending_requests:
-            return None
+        # Move expired requests from pending to rejected. Only the heap
+        # entries whose deadline has passed are visited; entries for
+        # requests that were already approved or rejected are skipped.
+        now = time.monotonic()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            _, _, request = heapq.heappop(heap)
+            if self._index.get(id(request)) != 'pending':
+                continue
+            
+            request.status = ApprovalStatus.EXPIRED
+            self._settle(request, 'rejected')
         
-        return self.pending_requests[0]
+        return next(iter(self.pending_requests.values()), None)
     
     def approve_request(self, request: ApprovalRequest, 
                         approver: str = 'user') -> bool:
@@ -187,12 +324,11 @@ class ApprovalHandler:
         Returns:
             True if approved, False otherwise
         """
-        if request not in self.pending_requests:
+        if self._index.get(id(request)) != 'pending':
             return False
         
         if request.approve(approver):
-            self.pending_requests.remove(request)
-            self.approved_requests.append(request)
+            self._settle(request, 'approved')
             return True
         return False
     
@@ -208,24 +344,56 @@ class ApprovalHandler:
         Returns:
             True if rejected, False otherwise
         """
-        if request not in self.pending_requests:
+        if self._index.get(id(request)) != 'pending':
             return False
         
         if request.reject(approver):
-            self.pending_requests.remove(request)
-            self.rejected_requests.append(request)
+            self._settle(request, 'rejected')
             return True
         return False
     
-    def get_approval_status(self, request: ApprovalRequest) -> ApprovalStatus:
-        """Get the status of a request."""
-        if request in self.pending_requests:
-            return request.status
+    async def await_approval(self, request: ApprovalRequest,
+                             initial: Optional[float] = None,
+                             max_interval: Optional[float] = None) -> ApprovalStatus:
+        """
+        Wait until a request is approved, rejected, or expires.
         
-        if request in self.approved_requests:
-            return request.status
+        Polls with exponential backoff: early checks are frequent so fast
+        approvals are picked up quickly, later checks back off up to
+        max_interval. Sleeps never run past the request's deadline.
         
-        if request in self.rejected_requests:
+        Args:
+            request: The request to wait on
+            initial: Initial polling interval in seconds
+                (defaults to poll_interval)
+            max_interval: Maximum polling interval in seconds
+                (defaults to max_poll_interval)
+            
+        Returns:
+            Final status of the request
+        """
+        interval = initial if initial is not None else self.poll_interval
+        if max_interval is None:
+            max_interval = self.max_poll_interval
+        
+        while request.status == ApprovalStatus.PENDING:
+            remaining = request.time_remaining()
+            if remaining <= 0:
+                # Moves expired requests out of the pending list
+                self.get_pending_request()
+                if request.status == ApprovalStatus.PENDING:
+                    return ApprovalStatus.EXPIRED
+                break
+            
+            await asyncio.sleep(min(interval, max_interval, remaining))
+            interval *= 1.5
+        
+        return request.status
+    
+    def get_approval_status(self, request: ApprovalRequest) -> ApprovalStatus:
+        """Get the status of a request."""
+        # Settled requests keep their outcome after leaving the bounded history
+        if id(request) in self._index or request.status != ApprovalStatus.PENDING:
             return request.status
         
         return ApprovalStatus.EXPIRED
@@ -234,7 +402,7 @@ class ApprovalHandler:
         """Get all requests as dictionaries."""
         all_requests = []
         
-        for request in self.pending_requests:
+        for request in self.pending_requests.values():
             all_requests.append(request.to_dict())
         
         for request in self.approved_requests:
@@ -258,6 +426,8 @@ class ApprovalHandler:
         self.pending_requests.clear()
         self.approved_requests.clear()
         self.rejected_requests.clear()
+        self._index.clear()
+        self._expiry_heap.clear()
 
 
 # Global approval handler instance
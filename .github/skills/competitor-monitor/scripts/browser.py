@@ -7,9 +7,57 @@ Validates: Requirements 2.1, 2.2, 2.3
 import asyncio
 import random
 import time
+from contextlib import asynccontextmanager
 from typing import Optional
 from playwright.async_api import async_playwright
 
+from defense_bypass import _USER_AGENTS
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# Collects the visible text of the page body, skipping script/style content
+_EXTRACT_TEXT_JS = '''() => {
+    // Remove script, style, and noscript elements
+    const elements = document.querySelectorAll('script, style, noscript');
+    elements.forEach(el => el.remove());
+    
+    // Get body text
+    const body = document.body;
+    if (!body) return '';
+    
+    // Fast path: native innerText, which also skips CSS-hidden content
+    const innerText = body.innerText;
+    if (innerText && innerText.trim().length > 0) {
+        return innerText;
+    }
+    
+    // Fallback: get all text nodes
+    const walker = document.createTreeWalker(
+        body,
+        NodeFilter.SHOW_TEXT,
+        null
+    );
+    
+    const texts = [];
+    let node;
+    while (node = walker.nextNode()) {
+        // Filter out whitespace-only text nodes
+        const text = node.textContent.trim();
+        if (text.length > 0) {
+            texts.push(text);
+        }
+    }
+    
+    return texts.join('\\n');
+}'''
+
+# Installed once per context so each page has the extractor compiled up front
+_EXTRACT_TEXT_INIT_SCRIPT = f'window.__extractText = {_EXTRACT_TEXT_JS};'
+
 
 class CompetitorBrowser:
     """Handles autonomous web browsing for competitor intelligence gathering."""
@@ -24,155 +72,186 @@ class CompetitorBrowser:
         """
         self.headless = headless
         self.timeout = timeout
-        self.user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
-        ]
+        self.user_agents = _USER_AGENTS
+        self._rng = random.Random()
+        self._playwright = None
+        self._browser = None
     
-    async def extract_text_from_url(self, url: str) -> Optional[str]:
+    @property
+    def is_running(self) -> bool:
+        """Whether a shared browser is currently launched."""
+        return self._browser is not None
+    
+    async def __aenter__(self) -> 'CompetitorBrowser':
+        """Launch Playwright and Chromium once for reuse across extractions."""
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the shared browser and stop Playwright."""
+        await self.close()
+    
+    @asynccontextmanager
+    async def _one_off_browser(self):
         """
-        Navigate to a URL and extract visible text content from the DOM.
+        Launch a browser for a single call outside ``async with``.
         
-        Args:
-            url: The URL to scrape
-            
-        Returns:
-            Extracted text content or None if extraction failed
+        The browser lives in locals only, so concurrent calls each get their
+        own and never replace or close the shared one.
         """
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=self.headless)
-            context = await browser.new_context(
-                user_agent=random.choice(self.user_agents),
-                viewport={'width': 1920, 'height': 1080}
-            )
-            
-            page = await context.new_page()
-            page.set_default_timeout(self.timeout)
-            
+        playwright = await async_playwright().start()
+        try:
+            browser = await playwright.chromium.launch(headless=self.headless)
             try:
-                # Navigate to URL with wait for DOM content
-                await page.goto(url, wait_until='domcontentloaded')
-                
-                # Wait for any dynamic content to load
-                await page.wait_for_load_state('networkidle')
-                
-                # Add random delay to avoid detection
-                await asyncio.sleep(random.uniform(1, 3))
-                
-                # Extract visible text content
-                text_content = await page.evaluate('''() => {
-                    // Remove script and style elements
-                    const elements = document.querySelectorAll('script, style, noscript');
-                    elements.forEach(el => el.remove());
-                    
-                    // Get body text
-                    const body = document.body;
-                    if (!body) return '';
-                    
-                    // Get all text nodes
-                    const walker = document.createTreeWalker(
-                        body,
-                        NodeFilter.SHOW_TEXT,
-                        null
-                    );
-                    
-                    const texts = [];
-                    let node;
-                    while (node = walker.nextNode()) {
-                        // Filter out whitespace-only text nodes
-                        const text = node.textContent.trim();
-                        if (text.length > 0) {
-                            texts.push(text);
-                        }
-                    }
-                    
-                    return texts.join('\\n');
-                }''')
-                
+                yield browser
+            finally:
                 await browser.close()
-                return text_content if text_content else None
-                
-            except Exception as e:
-                print(f"Error extracting text from {url}: {str(e)}")
-                try:
-                    await browser.close()
-                except:
-                    pass
-                return None
-    
-    async def extract_text_with_defense_bypass(self, url: str) -> Optional[str]:
+        finally:
+            await playwright.stop()
+    
+    async def close(self) -> None:
+        """Close the shared browser and stop Playwright if they are running."""
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+    
+    async def extract(self, url: str, defense: bool = True,
+                      wait_selector: Optional[str] = None) -> Optional[str]:
         """
-        Extract text with basic web defense bypass techniques.
+        Navigate to a URL and extract visible text content from the DOM.
         
         Args:
             url: The URL to scrape
+            defense: Whether to use defense bypass techniques (random
+                delays and scrolling to trigger lazy loading)
+            wait_selector: Optional CSS selector to wait for before extracting
             
         Returns:
             Extracted text content or None if extraction failed
         """
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=self.headless)
-            context = await browser.new_context(
-                user_agent=random.choice(self.user_agents),
-                viewport={'width': 1920, 'height': 1080},
-                java_script_enabled=True
-            )
-            
-            page = await context.new_page()
-            page.set_default_timeout(self.timeout)
+        if self._browser is None:
+            # Not inside ``async with``: launch a browser just for this call
+            async with self._one_off_browser() as browser:
+                return await self._extract_with(browser, url, defense, wait_selector)
+        
+        return await self._extract_with(self._browser, url, defense, wait_selector)
+    
+    async def _extract_with(self, browser, url: str, defense: bool,
+                            wait_selector: Optional[str]) -> Optional[str]:
+        """Extract visible text from a URL in a new context of the given browser."""
+        context = await browser.new_context(
+            user_agent=self._rng.choice(self.user_agents),
+            viewport={'width': 1920, 'height': 1080},
+            java_script_enabled=True
+        )
+        await context.add_init_script(_EXTRACT_TEXT_INIT_SCRIPT)
+        
+        page = await context.new_page()
+        page.set_default_timeout(self.timeout)
+        
+        try:
+            # Navigate and wait for the content we need
+            await page.goto(url, wait_until='domcontentloaded')
+            if wait_selector:
+                await page.wait_for_selector(wait_selector, state='attached', timeout=5000)
             
-            try:
-                # Navigate with multiple wait strategies
-                await page.goto(url, wait_until='domcontentloaded')
-                await page.wait_for_load_state('networkidle')
-                
+            if defense:
                 # Add random delays between operations
-                await asyncio.sleep(random.uniform(2, 4))
+                await asyncio.sleep(self._rng.uniform(2, 4))
                 
                 # Scroll to trigger lazy loading
                 await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-                await asyncio.sleep(random.uniform(1, 2))
-                
-                # Extract text content
-                text_content = await page.evaluate('''() => {
-                    // Remove script, style, and noscript elements
-                    const elements = document.querySelectorAll('script, style, noscript');
-                    elements.forEach(el => el.remove());
-                    
-                    // Get body text
-                    const body = document.body;
-                    if (!body) return '';
-                    
-                    // Get all text nodes
-                    const walker = document.createTreeWalker(
-                        body,
-                        NodeFilter.SHOW_TEXT,
-                        null
-                    );
-                    
-                    const texts = [];
-                    let node;
-                    while (node = walker.nextNode()) {
-                        const text = node.textContent.trim();
-                        if (text.length > 0) {
-                            texts.push(text);
-                        }
-                    }
-                    
-                    return texts.join('\\n');
-                }''')
-                
-                await browser.close()
-                return text_content if text_content else None
-                
-            except Exception as e:
-                print(f"Error with defense bypass for {url}: {str(e)}")
-                try:
-                    await browser.close()
-                except:
-                    pass
-                return None
+                await asyncio.sleep(self._rng.uniform(1, 2))
+            else:
+                # Short settling delay for dynamic content
+                await page.wait_for_timeout(500)
+            
+            # Extract visible text content
+            text_content = await page.evaluate('window.__extractText()')
+            
+            return text_content if text_content else None
+        
+        except Exception as e:
+            print(f"Error extracting text from {url}: {str(e)}")
+            return None
+        finally:
+            await context.close()
+    
+    async def extract_text_from_url(self, url: str,
+                                    wait_selector: Optional[str] = None) -> Optional[str]:
+        """Extract visible text from a URL without defense bypass."""
+        return await self.extract(url, defense=False, wait_selector=wait_selector)
+    
+    async def extract_text_with_defense_bypass(self, url: str,
+                                               wait_selector: Optional[str] = None) -> Optional[str]:
+        """Extract visible text from a URL with defense bypass techniques."""
+        return await self.extract(url, defense=True, wait_selector=wait_selector)
+    
+    async def scrape_many(self, urls: list[str], concurrency: int = 8,
+                          use_defense_bypass: bool = True) -> list[Optional[str]]:
+        """
+        Scrape several URLs concurrently, bounded by a semaphore.
+        
+        Args:
+            urls: The URLs to scrape
+            concurrency: Maximum number of pages open at the same time
+            use_defense_bypass: Whether to use defense bypass techniques
+            
+        Returns:
+            Extracted text content (or None on failure) for each URL, in order
+        """
+        if self._browser is None:
+            async with self._one_off_browser() as browser:
+                return await self._scrape_many_with(browser, urls, concurrency, use_defense_bypass)
+        
+        return await self._scrape_many_with(self._browser, urls, concurrency, use_defense_bypass)
+    
+    async def _scrape_many_with(self, browser, urls: list[str], concurrency: int,
+                                use_defense_bypass: bool) -> list[Optional[str]]:
+        """Scrape several URLs concurrently on the given browser; see scrape_many."""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _scrape_one(url: str) -> Optional[str]:
+            async with semaphore:
+                return await self._extract_with(browser, url, use_defense_bypass, None)
+        
+        # return_exceptions so one failing site doesn't cancel the whole batch
+        results = await asyncio.gather(
+            *(_scrape_one(url) for url in urls),
+            return_exceptions=True
+        )
+        
+        texts = []
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                print(f"Error scraping {url}: {str(result)}")
+                texts.append(None)
+            else:
+                texts.append(result)
+        return texts
+
+
+def use_uvloop() -> bool:
+    """
+    Switch asyncio to the uvloop event loop if it is installed.
+    
+    Must be called before asyncio.run. Lowers event loop overhead for
+    large concurrent scrape batches.
+    
+    Returns:
+        True if uvloop is now the event loop policy, False otherwise
+    """
+    if uvloop is None:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
 
 
 async def scrape_competitor(url: str, use_defense_bypass: bool = True) -> Optional[str]:
@@ -186,12 +265,25 @@ async def scrape_competitor(url: str, use_defense_bypass: bool = True) -> Option
     Returns:
         Extracted text content or None if extraction failed
     """
-    browser = CompetitorBrowser()
+    async with CompetitorBrowser() as browser:
+        return await browser.extract(url, defense=use_defense_bypass)
+
+
+async def scrape_many(urls: list[str], use_defense_bypass: bool = True,
+                      concurrency: int = 8) -> list[Optional[str]]:
+    """
+    Scrape several competitor websites concurrently with a single shared browser.
     
-    if use_defense_bypass:
-        return await browser.extract_text_with_defense_bypass(url)
-    else:
-        return await browser.extract_text_from_url(url)
+    Args:
+        urls: The URLs to scrape
+        use_defense_bypass: Whether to use defense bypass techniques
+        concurrency: Maximum number of pages open at the same time
+        
+    Returns:
+        Extracted text content (or None on failure) for each URL, in order
+    """
+    async with CompetitorBrowser() as browser:
+        return await browser.scrape_many(urls, concurrency, use_defense_bypass)
 
 
 if __name__ == '__main__':
@@ -207,4 +299,5 @@ if __name__ == '__main__':
         else:
             print("Failed to extract content")
     
+    use_uvloop()
     asyncio.run(test())
@@ -4,58 +4,104 @@ Implements user agent rotation, random delays, and basic CAPTCHA detection.
 Validates: Requirements 2.4
 """
 
+import asyncio
 import random
+import re
 import time
-from typing import Optional
+from typing import Optional, Union
+
+
+# Common user agents, shared with browser.py
+_USER_AGENTS = (
+    # Chrome on Windows
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    # Safari on macOS
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15",
+    # Firefox on Windows
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
+    # Chrome on Linux
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    # Edge on Windows
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0",
+)
+
+# Common browser fingerprints for rotation
+_BROWSER_FINGERPRINTS = (
+    {
+        'platform': 'Win32',
+        'language': 'en-US',
+        'vendor': 'Google Inc.',
+    },
+    {
+        'platform': 'MacIntel',
+        'language': 'en-US',
+        'vendor': 'Apple Inc.',
+    },
+    {
+        'platform': 'Linux x86_64',
+        'language': 'en-US',
+        'vendor': '',
+    },
+)
+
+# Markers that indicate a CAPTCHA or bot challenge on a page
+_CAPTCHA_INDICATORS = (
+    'recaptcha',
+    'captcha',
+    'g-recaptcha',
+    'hcaptcha',
+    'cf-turnstile',
+    'challenge-form',
+    'verify',
+    'I am not a robot',
+    'Enter the characters you see',
+)
+
+# All indicators in one case-insensitive pattern so the page is scanned once
+_CAPTCHA_RE = re.compile(
+    '|'.join(re.escape(indicator) for indicator in _CAPTCHA_INDICATORS),
+    re.IGNORECASE
+)
+# Same pattern for raw response bodies, so bytes never need decoding
+_CAPTCHA_BYTES_RE = re.compile(
+    b'|'.join(re.escape(indicator.encode('ascii')) for indicator in _CAPTCHA_INDICATORS),
+    re.IGNORECASE
+)
 
 
 class DefenseBypass:
     """Handles basic web defense bypass techniques."""
     
+    # Browser-like request headers; only User-Agent is rotated per call
+    _BASE_HEADERS = {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Sec-Fetch-User': '?1',
+    }
+    
     def __init__(self):
         """Initialize defense bypass with common user agents."""
-        self.user_agents = [
-            # Chrome on Windows
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            # Safari on macOS
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15",
-            # Firefox on Windows
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
-            # Chrome on Linux
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            # Edge on Windows
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0",
-        ]
+        self.user_agents = _USER_AGENTS
         
         # Common browser fingerprints for rotation
-        self.browser_fingerprints = [
-            {
-                'platform': 'Win32',
-                'language': 'en-US',
-                'vendor': 'Google Inc.',
-                'platform': 'Win32'
-            },
-            {
-                'platform': 'MacIntel',
-                'language': 'en-US',
-                'vendor': 'Apple Inc.',
-                'platform': 'MacIntel'
-            },
-            {
-                'platform': 'Linux x86_64',
-                'language': 'en-US',
-                'vendor': '',
-                'platform': 'Linux x86_64'
-            }
-        ]
+        self.browser_fingerprints = _BROWSER_FINGERPRINTS
+        
+        # Per-instance generator avoids the shared module-level random state
+        self._rng = random.Random()
     
     def get_random_user_agent(self) -> str:
         """Get a random user agent from the list."""
-        return random.choice(self.user_agents)
+        return self._rng.choice(self.user_agents)
     
     def get_random_fingerprint(self) -> dict:
         """Get a random browser fingerprint."""
-        return random.choice(self.browser_fingerprints)
+        return self._rng.choice(self.browser_fingerprints)
     
     def get_random_delay(self, min_seconds: float = 1.0, max_seconds: float = 3.0) -> float:
         """
@@ -68,12 +114,30 @@ class DefenseBypass:
         Returns:
             Random delay in seconds
         """
-        return random.uniform(min_seconds, max_seconds)
+        return self._rng.uniform(min_seconds, max_seconds)
+    
+    def get_random_strategies(self, n: int) -> list[tuple[str, dict, float]]:
+        """
+        Draw user agents, fingerprints and delays for several attempts at once.
+        
+        Args:
+            n: Number of strategies to generate
+            
+        Returns:
+            List of (user_agent, fingerprint, delay) tuples
+        """
+        user_agents = self._rng.choices(self.user_agents, k=n)
+        fingerprints = self._rng.choices(self.browser_fingerprints, k=n)
+        delays = [self._rng.uniform(1.0, 3.0) for _ in range(n)]
+        return list(zip(user_agents, fingerprints, delays))
     
     def add_delay(self, min_seconds: float = 1.0, max_seconds: float = 3.0) -> None:
         """
         Add a random delay to avoid detection.
         
+        This blocks the calling thread; from async code use async_delay
+        instead, or the whole event loop will stall.
+        
         Args:
             min_seconds: Minimum delay in seconds
             max_seconds: Maximum delay in seconds
@@ -81,6 +145,16 @@ class DefenseBypass:
         delay = self.get_random_delay(min_seconds, max_seconds)
         time.sleep(delay)
     
+    async def async_delay(self, min_seconds: float = 1.0, max_seconds: float = 3.0) -> None:
+        """
+        Add a random delay without blocking the event loop.
+        
+        Args:
+            min_seconds: Minimum delay in seconds
+            max_seconds: Maximum delay in seconds
+        """
+        await asyncio.sleep(self.get_random_delay(min_seconds, max_seconds))
+    
     def rotate_headers(self, base_headers: Optional[dict] = None) -> dict:
         """
         Rotate HTTP headers to avoid detection.
@@ -91,48 +165,27 @@ class DefenseBypass:
         Returns:
             Rotated headers dictionary
         """
-        headers = base_headers or {}
+        headers = dict(base_headers) if base_headers else {}
         
-        # Add random user agent
+        # Add common headers and a random user agent
+        headers.update(self._BASE_HEADERS)
         headers['User-Agent'] = self.get_random_user_agent()
         
-        # Add common headers
-        headers['Accept'] = 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
-        headers['Accept-Language'] = 'en-US,en;q=0.5'
-        headers['Accept-Encoding'] = 'gzip, deflate, br'
-        headers['Connection'] = 'keep-alive'
-        headers['Upgrade-Insecure-Requests'] = '1'
-        headers['Sec-Fetch-Dest'] = 'document'
-        headers['Sec-Fetch-Mode'] = 'navigate'
-        headers['Sec-Fetch-Site'] = 'none'
-        headers['Sec-Fetch-User'] = '?1'
-        
         return headers
     
-    def detect_captcha(self, html_content: str) -> bool:
+    def detect_captcha(self, html_content: Union[str, bytes]) -> bool:
         """
         Detect if a page contains CAPTCHA elements.
         
         Args:
-            html_content: HTML content to analyze
+            html_content: HTML content to analyze, as text or raw bytes
             
         Returns:
             True if CAPTCHA is detected, False otherwise
         """
-        captcha_indicators = [
-            'recaptcha',
-            'captcha',
-            'g-recaptcha',
-            'hcaptcha',
-            'cf-turnstile',
-            'challenge-form',
-            'verify',
-            'I am not a robot',
-            'Enter the characters you see',
-        ]
-        
-        content_lower = html_content.lower()
-        return any(indicator in content_lower for indicator in captcha_indicators)
+        if isinstance(html_content, (bytes, bytearray)):
+            return _CAPTCHA_BYTES_RE.search(html_content) is not None
+        return _CAPTCHA_RE.search(html_content) is not None
     
     def get_rotation_strategy(self, attempt_number: int) -> dict:
         """
@@ -5,8 +5,47 @@ Validates: Requirements 2.3
 """
 
 import re
+from html import unescape as _html_unescape
 from typing import Optional
 
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+
+# Fallback patterns used when lxml is not installed. They drop the same
+# content as the lxml path: the EXCLUDED_TAGS that hold text (the rest are
+# void and vanish with the other tags), and elements with a whole "hidden"
+# class token, so e.g. "overflow-hidden" wrappers keep their text
+_EXCLUDED_TAGS_RE = re.compile(
+    r'<(script|style|noscript|head|title)\b[^>]*>.*?</\1\s*>',
+    re.DOTALL | re.IGNORECASE
+)
+_HIDDEN_RE = re.compile(
+    r'<[^>]*(?:'
+    r'style="[^"]*display:\s*none[^"]*"'
+    r'|style=\'[^\']*display:\s*none[^\']*\''
+    r'|class="(?:[^"]*\s)?hidden(?:\s[^"]*)?"'
+    r'|class=\'(?:[^\']*\s)?hidden(?:\s[^\']*)?\''
+    r'|aria-hidden="true"'
+    r'|data-hidden="true"'
+    r')[^>]*>.*?</[^>]+>',
+    re.DOTALL | re.IGNORECASE
+)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Finds the attribute part of any _HIDDEN_RE match without its DOTALL
+# element scan; unlike a bare 'hidden' it ignores type="hidden" inputs
+_HIDDEN_MARKER_RE = re.compile(
+    r'display:\s*none|class="[^"]*hidden|class=\'[^\']*hidden|(?:aria|data)-hidden="true"',
+    re.IGNORECASE
+)
+
+# Text cleanup pattern
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 class DOMTextExtractor:
     """Extracts visible text content from HTML DOM."""
@@ -26,6 +65,9 @@ class DOMTextExtractor:
     def __init__(self):
         """Initialize the DOM text extractor."""
         self.text_nodes = []
+        # Last input and its extracted text, reused when the same HTML is passed again
+        self._last_html: Optional[str] = None
+        self._last_text: Optional[str] = None
     
     def extract_text(self, html_content: str) -> str:
         """
@@ -37,81 +79,101 @@ class DOMTextExtractor:
         Returns:
             Extracted text content
         """
-        # Remove script and style elements
-        html = self._remove_excluded_tags(html_content)
-        
-        # Remove hidden elements
-        html = self._remove_hidden_elements(html)
+        # Reuse the previous result when called again with the same string
+        if html_content is self._last_html:
+            return self._last_text
         
         # Extract text
-        text = self._html_to_text(html)
+        text = self._extract_raw_text(html_content)
         
         # Clean up text
         text = self._clean_text(text)
         
+        self._last_html = html_content
+        self._last_text = text
         return text
     
-    def _remove_excluded_tags(self, html: str) -> str:
-        """Remove script, style, and other excluded tags."""
-        # Remove script tags and their content
-        html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
+    def _extract_raw_text(self, html_content: str) -> str:
+        """Extract uncleaned text, using lxml when it is installed."""
+        if lxml_html is not None:
+            return self._extract_raw_text_lxml(html_content)
         
-        # Remove style tags and their content
-        html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
+        # Remove script and style elements
+        html = self._remove_excluded_tags(html_content)
         
-        # Remove noscript tags
-        html = re.sub(r'<noscript[^>]*>.*?</noscript>', '', html, flags=re.DOTALL | re.IGNORECASE)
+        # Remove hidden elements
+        html = self._remove_hidden_elements(html)
         
-        return html
+        return self._html_to_text(html)
     
-    def _remove_hidden_elements(self, html: str) -> str:
-        """Remove hidden elements from HTML."""
-        # Remove elements with display: none
-        html = re.sub(r'<[^>]*style="[^"]*display:\s*none[^"]*"[^>]*>.*?</[^>]+>', '', html, flags=re.DOTALL | re.IGNORECASE)
-        html = re.sub(r'<[^>]*style=\'[^\']*display:\s*none[^\']*\'[^>]*>.*?</[^>]+>', '', html, flags=re.DOTALL | re.IGNORECASE)
+    def _extract_raw_text_lxml(self, html_content: str) -> str:
+        """Extract uncleaned text with a single lxml parse."""
+        if not html_content.strip():
+            return ''
         
-        # Remove elements with hidden class
-        html = re.sub(r'<[^>]*class="[^"]*hidden[^"]*"[^>]*>.*?</[^>]+>', '', html, flags=re.DOTALL | re.IGNORECASE)
-        html = re.sub(r'<[^>]*class=\'[^\']*hidden[^\']*\'[^>]*>.*?</[^>]+>', '', html, flags=re.DOTALL | re.IGNORECASE)
+        try:
+            try:
+                root = lxml_html.fromstring(html_content)
+            except ValueError:
+                # lxml rejects str input with an XML encoding declaration
+                # (XHTML); parse the UTF-8 bytes with the encoding pinned so
+                # the declaration cannot override it
+                root = lxml_html.fromstring(
+                    html_content.encode('utf-8'),
+                    parser=lxml_html.HTMLParser(encoding='utf-8')
+                )
+        except etree.ParserError:
+            return ''
         
-        # Remove elements with aria-hidden="true"
-        html = re.sub(r'<[^>]*aria-hidden="true"[^>]*>.*?</[^>]+>', '', html, flags=re.DOTALL | re.IGNORECASE)
+        # Drop excluded elements along with their content
+        etree.strip_elements(root, *self.EXCLUDED_TAGS, with_tail=False)
         
-        return html
+        # Drop hidden elements but keep the text that follows them; the root
+        # itself is kept, since dropping it would discard the whole page
+        hidden = [el for el in root.iterdescendants(etree.Element) if self._is_hidden(el)]
+        for el in hidden:
+            el.drop_tree()
+        
+        return ' '.join(root.itertext())
+    
+    @staticmethod
+    def _is_hidden(element) -> bool:
+        """Check whether an element is hidden via style, class or ARIA attributes."""
+        if element.get('aria-hidden') == 'true' or element.get('data-hidden') == 'true':
+            return True
+        # Whole class tokens only: "overflow-hidden" is a layout utility
+        if 'hidden' in (element.get('class') or '').lower().split():
+            return True
+        style = (element.get('style') or '').replace(' ', '').lower()
+        return 'display:none' in style
+    
+    def _remove_excluded_tags(self, html: str) -> str:
+        """Remove script, style, noscript, head and title tags with their content."""
+        return _EXCLUDED_TAGS_RE.sub('', html)
+    
+    def _remove_hidden_elements(self, html: str) -> str:
+        """Remove hidden elements (display: none, hidden class, aria-hidden) from HTML."""
+        # Most pages have no hidden markers at all; one case-insensitive
+        # search is much cheaper than running the DOTALL regex over the whole
+        # document, and needs no lowercased copy of it
+        if not _HIDDEN_MARKER_RE.search(html):
+            return html
+        return _HIDDEN_RE.sub('', html)
     
     def _html_to_text(self, html: str) -> str:
         """Convert HTML to plain text."""
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', ' ', html)
+        text = _TAG_RE.sub(' ', html)
         
-        # Replace HTML entities
-        text = text.replace('&nbsp;', ' ')
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&quot;', '"')
-        text = text.replace('&#39;', "'")
+        # Decode all named and numeric HTML entities in one pass
+        text = _html_unescape(text)
         
         return text
     
     def _clean_text(self, text: str) -> str:
         """Clean up extracted text."""
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove leading/trailing whitespace from lines
-        lines = [line.strip() for line in text.split('\n')]
-        
-        # Filter empty lines
-        lines = [line for line in lines if line]
-        
-        # Join lines
-        text = '\n'.join(lines)
-        
-        # Remove excessive newlines
-        text = re.sub(r'\n\s*\n', '\n\n', text)
-        
-        return text.strip()
+        # Collapse all whitespace runs (including newlines) to single spaces
+        return _WHITESPACE_RE.sub(' ', text).strip()
     
     def extract_text_nodes(self, html_content: str) -> list[str]:
         """
@@ -123,15 +185,8 @@ class DOMTextExtractor:
         Returns:
             List of text nodes
         """
-        # Remove excluded tags
-        html = self._remove_excluded_tags(html_content)
-        
-        # Remove hidden elements
-        html = self._remove_hidden_elements(html)
-        
         # Extract text nodes
-        text = self._html_to_text(html)
-        text = self._clean_text(text)
+        text = self.extract_text(html_content)
         
         # Split into individual text nodes
         nodes = [node.strip() for node in text.split('\n') if node.strip()]
@@ -150,12 +205,19 @@ class DOMTextExtractor:
         """
         text = self.extract_text(html_content)
         
+        # Split once and reuse the token lists for every statistic
+        words = text.split()
+        lines = text.split('\n')
+        total_words = len(words)
+        total_lines = len(lines)
+        
         return {
             'total_characters': len(text),
-            'total_words': len(text.split()),
-            'total_lines': len(text.split('\n')),
-            'average_word_length': sum(len(word) for word in text.split()) / max(len(text.split()), 1),
-            'average_line_length': sum(len(line) for line in text.split('\n')) / max(len(text.split('\n')), 1),
+            'total_words': total_words,
+            'total_lines': total_lines,
+            'average_word_length': sum(map(len, words)) / max(total_words, 1),
+            # Line lengths sum to the text length minus the newline separators
+            'average_line_length': (len(text) - (total_lines - 1)) / max(total_lines, 1),
         }
 
 
@@ -6,10 +6,31 @@ Validates: Requirements 9.1, 9.2, 9.3, 9.4
 
 import json
 import logging
+import sys
+from collections import Counter, defaultdict
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Canonical interned error types; records and index keys share these objects
+_ERROR_TYPES = {t: sys.intern(t) for t in ('configuration', 'network', 'script', 'report')}
+
+# Longer keys are left un-interned so arbitrary input can't grow the intern table
+_MAX_INTERN_LENGTH = 128
+
+
+def _intern_key(value: Optional[str]) -> Optional[str]:
+    """Intern a short string key so dict lookups can match by identity."""
+    if value is None or len(value) > _MAX_INTERN_LENGTH:
+        return value
+    return sys.intern(value)
+
 
 class ErrorHandler:
     """Handles errors and maintains error logs for the intelligence workflow."""
@@ -23,6 +44,9 @@ class ErrorHandler:
         """
         self.log_dir = Path(log_dir)
         self.errors = []
+        # Error records indexed by type and by competitor name
+        self._by_type: dict[str, list[dict]] = defaultdict(list)
+        self._by_competitor: dict[Optional[str], list[dict]] = defaultdict(list)
         self._setup_logging()
     
     def _setup_logging(self):
@@ -56,8 +80,11 @@ class ErrorHandler:
         Returns:
             Error record dictionary
         """
+        error_type = _ERROR_TYPES.get(error_type) or _intern_key(error_type)
+        competitor_name = _intern_key(competitor_name)
+        
         error_record = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
             'error_type': error_type,
             'message': message,
             'competitor_name': competitor_name,
@@ -65,11 +92,13 @@ class ErrorHandler:
         }
         
         self.errors.append(error_record)
+        self._by_type[error_type].append(error_record)
+        self._by_competitor[competitor_name].append(error_record)
         
-        # Log to file
+        # Log to file; formatting is deferred until a handler accepts the record
         self.logger.error(
-            f"[{error_type}] {message} "
-            f"(competitor: {competitor_name or 'N/A'})"
+            "[%s] %s (competitor: %s)",
+            error_type, message, competitor_name or 'N/A'
         )
         
         return error_record
@@ -99,11 +128,11 @@ class ErrorHandler:
     
     def get_errors_by_type(self, error_type: str) -> list[dict]:
         """Get errors filtered by type."""
-        return [e for e in self.errors if e['error_type'] == error_type]
+        return list(self._by_type.get(error_type, ()))
     
     def get_errors_by_competitor(self, competitor_name: str) -> list[dict]:
         """Get errors filtered by competitor."""
-        return [e for e in self.errors if e['competitor_name'] == competitor_name]
+        return list(self._by_competitor.get(competitor_name, ()))
     
     def has_errors(self) -> bool:
         """Check if any errors have been logged."""
@@ -111,29 +140,21 @@ class ErrorHandler:
     
     def get_error_summary(self) -> dict:
         """Get a summary of all errors."""
-        summary = {
+        errors_by_type = Counter(e['error_type'] for e in self.errors)
+        errors_by_competitor = Counter(e['competitor_name'] or 'N/A' for e in self.errors)
+        
+        return {
             'total_errors': len(self.errors),
-            'errors_by_type': {},
-            'errors_by_competitor': {},
+            'errors_by_type': dict(errors_by_type),
+            'errors_by_competitor': dict(errors_by_competitor),
             'timestamp': datetime.now().isoformat()
         }
-        
-        for error in self.errors:
-            # Count by type
-            error_type = error['error_type']
-            summary['errors_by_type'][error_type] = \
-                summary['errors_by_type'].get(error_type, 0) + 1
-            
-            # Count by competitor
-            competitor = error['competitor_name'] or 'N/A'
-            summary['errors_by_competitor'][competitor] = \
-                summary['errors_by_competitor'].get(competitor, 0) + 1
-        
-        return summary
     
     def clear_errors(self):
         """Clear all logged errors."""
         self.errors = []
+        self._by_type.clear()
+        self._by_competitor.clear()
     
     def save_error_summary(self, output_path: Optional[str] = None) -> Optional[str]:
         """
@@ -151,12 +172,17 @@ class ErrorHandler:
         try:
             summary = self.get_error_summary()
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2)
+            if orjson is not None:
+                with open(output_path, 'wb') as f:
+                    f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+            else:
+                # json.dumps (unlike json.dump) uses the C encoder when not indenting
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    f.write(json.dumps(summary, separators=(',', ':')))
             
             return str(output_path)
         except Exception as e:
-            self.logger.error(f"Failed to save error summary: {e}")
+            self.logger.error("Failed to save error summary: %s", e)
             return None
 
 
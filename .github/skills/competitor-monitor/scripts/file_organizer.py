@@ -4,12 +4,43 @@ Handles report naming and directory management.
 Validates: Requirements 6.1, 6.2, 6.3
 """
 
+import asyncio
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 
+# (content, date, competitor_name) arguments for one FileOrganizer.save_report call
+ReportItem = tuple[str, Optional[datetime], Optional[str]]
+
+
+def _default_file_mode() -> int:
+    """
+    Get the mode a plainly created file gets under the process umask.
+    
+    Reads the umask from /proc where available, since the only portable
+    way to query it (setting and restoring it) briefly changes it for
+    every thread in the process.
+    
+    Returns:
+        File permission bits
+    """
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('Umask:'):
+                    return 0o666 & ~int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
 class FileOrganizer:
     """Organizes intelligence reports with standardized naming and structure."""
     
@@ -23,6 +54,9 @@ class FileOrganizer:
             reports_dir: Base directory for reports
         """
         self.reports_dir = Path(reports_dir)
+        # mkstemp creates files as 0600; saved reports get the usual mode.
+        # Resolved here, not in save_report, which may run on worker threads
+        self._file_mode = _default_file_mode()
     
     def generate_filename(self, date: Optional[datetime] = None) -> str:
         """
@@ -60,34 +94,129 @@ class FileOrganizer:
         else:
             return self.reports_dir / filename
     
+    @staticmethod
+    def _sync_directory(directory: Path) -> None:
+        """
+        Flush a directory entry to disk so completed renames survive a crash.
+        
+        Args:
+            directory: Directory containing the renamed report files
+        """
+        # O_DIRECTORY is not available everywhere (e.g. Windows)
+        flags = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0)
+        try:
+            fd = os.open(directory, flags)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    
     def save_report(self, content: str, date: Optional[datetime] = None,
-                    competitor_name: Optional[str] = None) -> Optional[Path]:
+                    competitor_name: Optional[str] = None,
+                    sync: bool = True) -> Optional[Path]:
         """
         Save a report to the appropriate location.
         
+        The report is written to a temporary file and moved into place with
+        os.replace, so readers never see a partially written report.
+        
         Args:
             content: Report content to save
             date: Date for the report (defaults to today)
             competitor_name: Optional competitor name for subdirectory
+            sync: Whether to fsync the report directory after the rename.
+                Batch callers pass False and sync each directory once.
             
         Returns:
             Path to saved file or None if saving failed
         """
+        tmp_path = None
         try:
             filepath = self.generate_filepath(date, competitor_name)
             
             # Create directory if it doesn't exist
             filepath.parent.mkdir(parents=True, exist_ok=True)
             
-            # Write report content
-            with open(filepath, 'w', encoding='utf-8') as f:
+            # Write report content to a uniquely named file next to the
+            # target, then swap it in; concurrent saves never share it
+            fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, suffix='.tmp')
+            with open(fd, 'w', encoding='utf-8') as f:
                 f.write(content)
+                # Data must be on disk before the rename publishes it
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_path, self._file_mode)
+            os.replace(tmp_path, filepath)
+            tmp_path = None
+            
+            if sync:
+                self._sync_directory(filepath.parent)
             
             return filepath
         except Exception as e:
             print(f"Error saving report: {e}")
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
             return None
     
+    def save_reports_batch(self, items: list[ReportItem]) -> list[Optional[Path]]:
+        """
+        Save several reports concurrently on a thread pool.
+        
+        Overlaps disk latency across reports and syncs each report directory
+        once at the end instead of after every file.
+        
+        Args:
+            items: (content, date, competitor_name) tuples, as for save_report
+            
+        Returns:
+            Path to each saved file (or None if saving failed), in input order
+        """
+        if not items:
+            return []
+        
+        results: list[Optional[Path]] = [None] * len(items)
+        with ThreadPoolExecutor(max_workers=min(32, len(items))) as executor:
+            futures = {
+                executor.submit(self.save_report, content, date, competitor_name, False): index
+                for index, (content, date, competitor_name) in enumerate(items)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        self._sync_saved(results)
+        return results
+    
+    async def save_reports_batch_async(self, items: list[ReportItem]) -> list[Optional[Path]]:
+        """
+        Save several reports concurrently without blocking the event loop.
+        
+        Args:
+            items: (content, date, competitor_name) tuples, as for save_report
+            
+        Returns:
+            Path to each saved file (or None if saving failed), in input order
+        """
+        results = list(await asyncio.gather(*(
+            asyncio.to_thread(self.save_report, content, date, competitor_name, False)
+            for content, date, competitor_name in items
+        )))
+        
+        await asyncio.to_thread(self._sync_saved, results)
+        return results
+    
+    def _sync_saved(self, paths: list[Optional[Path]]) -> None:
+        """Fsync each distinct directory that received a saved report."""
+        for directory in {path.parent for path in paths if path is not None}:
+            self._sync_directory(directory)
+    
     def get_reports_directory(self) -> Path:
         """
         Get the reports directory path.
@@ -121,15 +250,10 @@ class FileOrganizer:
         if not self.reports_dir.exists():
             return None
         
-        # Find all Intelligence.md files
-        reports = list(self.reports_dir.glob('*_Intelligence.md'))
-        
-        if not reports:
-            return None
-        
-        # Sort by filename (which includes date) and return most recent
-        reports.sort(key=lambda x: x.name, reverse=True)
-        return reports[0]
+        # Find all Intelligence.md files and return the most recent; the
+        # filename starts with the date, so the largest name is the newest
+        reports = self.reports_dir.glob('*_Intelligence.md')
+        return max(reports, key=lambda x: x.name, default=None)
     
     def get_competitor_reports(self, competitor_name: str) -> list[Path]:
         """
@@ -143,10 +267,15 @@ class FileOrganizer:
         """
         competitor_dir = self.reports_dir / competitor_name.replace(' ', '_')
         
-        if not competitor_dir.exists():
+        try:
+            with os.scandir(competitor_dir) as entries:
+                return [
+                    competitor_dir / entry.name
+                    for entry in entries
+                    if entry.name.endswith('_Intelligence.md')
+                ]
+        except (FileNotFoundError, NotADirectoryError):
             return []
-        
-        return list(competitor_dir.glob('*_Intelligence.md'))
 
 
 def save_intelligence_report(content: str, reports_dir: str = 'reports',
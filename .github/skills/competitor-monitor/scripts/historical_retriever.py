@@ -6,15 +6,20 @@ Validates: Requirements 3.1, 3.2, 3.3, 3.4
 
 import os
 import re
+from bisect import bisect_left
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 
+# Matches report filenames such as 2026-02-19_Intelligence.md
+_REPORT_RE = re.compile(r'^(\d{4}-\d{2}-\d{2})_Intelligence\.md$')
+
+
 class HistoricalRetriever:
     """Retrieves historical intelligence reports for comparison."""
     
-    REPORT_PATTERN = re.compile(r'^(\d{4}-\d{2}-\d{2})_Intelligence\.md$')
+    REPORT_PATTERN = _REPORT_RE
     
     def __init__(self, reports_dir: str = 'reports'):
         """
@@ -24,6 +29,55 @@ class HistoricalRetriever:
             reports_dir: Directory containing intelligence reports
         """
         self.reports_dir = Path(reports_dir)
+        # Parsed directory listing, reused until the directory mtime changes
+        self._listing_cache: Optional[list[tuple[datetime, Path]]] = None
+        self._listing_mtime: Optional[int] = None
+    
+    def _iter_reports(self) -> list[tuple[datetime, Path]]:
+        """
+        List the reports in the directory as (date, path) tuples.
+        
+        The listing is cached and only rebuilt when the directory's
+        modification time changes, i.e. when reports are added or removed.
+        
+        Returns:
+            List of (report date, report path) tuples sorted oldest first
+        """
+        try:
+            mtime = self.reports_dir.stat().st_mtime_ns
+        except OSError:
+            return []
+        
+        if self._listing_cache is not None and mtime == self._listing_mtime:
+            return self._listing_cache
+        
+        with os.scandir(self.reports_dir) as entries:
+            names = [entry.name for entry in entries if entry.name.endswith('.md')]
+        
+        # filter/map keep the per-name matching loop in C
+        reports = []
+        for match in filter(None, map(_REPORT_RE.match, names)):
+            # The pattern fixes the layout, so slice instead of strptime
+            date_str = match.group(1)
+            try:
+                report_date = datetime(
+                    int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10])
+                )
+            except ValueError:
+                # Skip files with invalid date format
+                continue
+            reports.append((report_date, self.reports_dir / match.string))
+        
+        reports.sort(key=lambda report: report[0])
+        self._listing_cache = reports
+        self._listing_mtime = mtime
+        return reports
+    
+    def _latest_before(self, before_date: datetime) -> Optional[Path]:
+        """Binary-search the sorted listing for the newest report before a date."""
+        reports = self._iter_reports()
+        index = bisect_left(reports, before_date, key=lambda report: report[0])
+        return reports[index - 1][1] if index > 0 else None
     
     def find_latest_report(self, before_date: Optional[datetime] = None) -> Optional[Path]:
         """
@@ -38,28 +92,7 @@ class HistoricalRetriever:
         if before_date is None:
             before_date = datetime.now()
         
-        if not self.reports_dir.exists():
-            return None
-        
-        latest_report = None
-        latest_date = None
-        
-        for file_path in self.reports_dir.glob('*.md'):
-            match = self.REPORT_PATTERN.match(file_path.name)
-            if match:
-                try:
-                    report_date = datetime.strptime(match.group(1), '%Y-%m-%d')
-                    
-                    # Check if report is before the target date
-                    if report_date < before_date:
-                        if latest_date is None or report_date > latest_date:
-                            latest_date = report_date
-                            latest_report = file_path
-                except ValueError:
-                    # Skip files with invalid date format
-                    continue
-        
-        return latest_report
+        return self._latest_before(before_date)
     
     def find_report_for_date(self, target_date: datetime) -> Optional[Path]:
         """
@@ -71,28 +104,8 @@ class HistoricalRetriever:
         Returns:
             Path to the closest report or None if no report found
         """
-        if not self.reports_dir.exists():
-            return None
-        
-        closest_report = None
-        closest_diff = None
-        
-        for file_path in self.reports_dir.glob('*.md'):
-            match = self.REPORT_PATTERN.match(file_path.name)
-            if match:
-                try:
-                    report_date = datetime.strptime(match.group(1), '%Y-%m-%d')
-                    
-                    # Only consider reports before the target date
-                    if report_date < target_date:
-                        diff = (target_date - report_date).days
-                        if closest_diff is None or diff < closest_diff:
-                            closest_diff = diff
-                            closest_report = file_path
-                except ValueError:
-                    continue
-        
-        return closest_report
+        # The closest report before the target is the newest one before it
+        return self._latest_before(target_date)
     
     def get_all_reports(self) -> list[Path]:
         """
@@ -101,19 +114,8 @@ class HistoricalRetriever:
         Returns:
             List of report file paths sorted by date
         """
-        if not self.reports_dir.exists():
-            return []
-        
-        reports = []
-        
-        for file_path in self.reports_dir.glob('*.md'):
-            if self.REPORT_PATTERN.match(file_path.name):
-                reports.append(file_path)
-        
-        # Sort by date (newest first)
-        reports.sort(key=lambda x: x.name, reverse=True)
-        
-        return reports
+        # The listing is sorted oldest first; reverse for newest first
+        return [file_path for _, file_path in reversed(self._iter_reports())]
     
     def get_report_date(self, file_path: Path) -> Optional[datetime]:
         """
@@ -125,7 +127,7 @@ class HistoricalRetriever:
         Returns:
             Date extracted from filename or None if invalid
         """
-        match = self.REPORT_PATTERN.match(file_path.name)
+        match = _REPORT_RE.match(file_path.name)
         if match:
             try:
                 return datetime.strptime(match.group(1), '%Y-%m-%d')
@@ -172,38 +174,44 @@ class HistoricalRetriever:
         Returns:
             Baseline text content or None if extraction fails
         """
-        content = self.get_report_content(file_path)
-        if content:
-            # Extract the main content section (between headers)
-            # This is a simplified extraction - in production, you'd want
-            # a more robust Markdown parser
-            lines = content.split('\n')
-            
-            # Find the main content section
-            content_lines = []
-            in_content = False
-            
-            for line in lines:
-                # Skip YAML frontmatter
-                if line.strip() == '---':
-                    continue
-                
-                # Skip headers
-                if line.startswith('#'):
-                    if in_content:
-                        break
-                    continue
-                
-                # Skip empty lines at the start
-                if not in_content and not line.strip():
-                    continue
-                
-                in_content = True
-                content_lines.append(line)
-            
-            return '\n'.join(content_lines).strip()
+        # Stream the file and stop at the end of the first section, so the
+        # rest of a large report is never read into memory
+        content_lines = []
+        in_content = False
+        empty = True
         
-        return None
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                # Extract the main content section (between headers)
+                # This is a simplified extraction - in production, you'd want
+                # a more robust Markdown parser
+                for line in f:
+                    empty = False
+                    line = line.rstrip('\n')
+                    
+                    # Skip YAML frontmatter
+                    if line.strip() == '---':
+                        continue
+                    
+                    # Skip headers
+                    if line.startswith('#'):
+                        if in_content:
+                            break
+                        continue
+                    
+                    # Skip empty lines at the start
+                    if not in_content and not line.strip():
+                        continue
+                    
+                    in_content = True
+                    content_lines.append(line)
+        except Exception:
+            return None
+        
+        if empty:
+            return None
+        
+        return '\n'.join(content_lines).strip()
 
 
 def find_latest_report(reports_dir: str = 'reports', before_date: Optional[datetime] = None) -> Optional[Path]:
@@ -5,13 +5,14 @@ Validates: Requirements 10.4
 """
 
 import asyncio
+import copy
 import json
 import os
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from browser import CompetitorBrowser
+from browser import CompetitorBrowser, use_uvloop
 from dom_extractor import DOMTextExtractor
 from historical_retriever import HistoricalRetriever
 from semantic_diff import SemanticDiffer
@@ -20,16 +21,26 @@ from file_organizer import FileOrganizer
 from error_handler import ErrorHandler
 from approval_handler import ApprovalHandler
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Parsed competitors.json per path, with the (mtime, size) it was parsed at
+_CONFIG_CACHE: dict[Path, tuple[tuple[int, int], dict]] = {}
+
 
 class CompetitorMonitor:
     """Main integration class for the competitor intelligence workflow."""
     
-    def __init__(self, workspace_dir: str = '.'):
+    def __init__(self, workspace_dir: str = '.', max_concurrency: int = 10):
         """
         Initialize the competitor monitor.
         
         Args:
             workspace_dir: Directory containing the workspace
+            max_concurrency: Maximum number of competitors processed at once
         """
         self.workspace_dir = Path(workspace_dir)
         self.reports_dir = Path(workspace_dir).resolve() / 'reports'
@@ -44,45 +55,122 @@ class CompetitorMonitor:
         self.error_handler = ErrorHandler()
         self.approval_handler = ApprovalHandler()
         
+        # Caps concurrent competitor processing to avoid rate limits; the
+        # semaphore is created per event loop, since it binds to the loop
+        # it is first used on (see _semaphore)
+        self.max_concurrency = max_concurrency
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._sem_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Extraction task per URL, shared by competitors with the same URL;
+        # only set while run_workflow is processing competitors
+        self._fetch_cache: Optional[dict[str, asyncio.Task]] = None
+        
+        # Event loop reused across process_competitor_sync calls
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
         # Ensure reports directory exists
         self.reports_dir.mkdir(parents=True, exist_ok=True)
     
+    async def __aenter__(self) -> 'CompetitorMonitor':
+        """Launch the shared browser once for every workflow run in this block."""
+        await self.browser.__aenter__()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the shared browser."""
+        await self.browser.close()
+    
     def load_competitors_config(self) -> Optional[dict]:
         """Load competitors configuration from JSON file."""
-        config_path = self.workspace_dir / 'competitors.json'
+        config_path = (self.workspace_dir / 'competitors.json').resolve()
         
-        if not config_path.exists():
+        try:
+            st = config_path.stat()
+        except OSError:
             self.error_handler.log_configuration_error(
                 "competitors.json not found"
             )
             return None
         
+        # Reuse the parsed config while the file is unchanged; callers get a
+        # deep copy so edits to it cannot leak into later loads
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _CONFIG_CACHE.get(config_path)
+        if cached is not None and cached[0] == stamp:
+            return copy.deepcopy(cached[1])
+        
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            if orjson is not None:
+                config = orjson.loads(config_path.read_bytes())
+            else:
+                with open(config_path, 'r') as f:
+                    config = json.load(f)
         except json.JSONDecodeError as e:
             self.error_handler.log_configuration_error(
                 f"Invalid JSON in competitors.json: {e}"
             )
             return None
+        
+        _CONFIG_CACHE[config_path] = (stamp, config)
+        return copy.deepcopy(config)
     
-    async def process_competitor(self, competitor: dict) -> dict:
+    def load_baseline(self) -> tuple[Optional[str], str]:
+        """
+        Load the baseline text and date from the latest historical report.
+        
+        Returns:
+            Tuple of (baseline text or None, baseline date or 'N/A')
+        """
+        historical_report = self.historical_retriever.find_latest_report()
+        
+        if not historical_report:
+            return None, 'N/A'
+        
+        historical_text = self.historical_retriever.get_baseline_text(historical_report)
+        baseline_date = self.historical_retriever.get_report_date(
+            historical_report
+        ).strftime('%Y-%m-%d')
+        return historical_text, baseline_date
+    
+    async def process_competitor(self, competitor: dict,
+                                 baseline: Optional[tuple[Optional[str], str]] = None,
+                                 today: Optional[str] = None) -> dict:
         """
         Process a single competitor.
         
         Args:
             competitor: Competitor configuration
+            baseline: Precomputed result of load_baseline, shared across
+                competitors; loaded here if not given
+            today: Analysis date (YYYY-MM-DD) shared across the workflow;
+                defaults to the current date
             
         Returns:
             Processing result dictionary
         """
+        async with self._semaphore():
+            return await self._process_competitor(competitor, baseline, today)
+    
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Get the concurrency semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._sem_loop is not loop:
+            self._sem = asyncio.Semaphore(self.max_concurrency)
+            self._sem_loop = loop
+        return self._sem
+    
+    async def _process_competitor(self, competitor: dict,
+                                  baseline: Optional[tuple[Optional[str], str]],
+                                  today: Optional[str]) -> dict:
+        """Process a single competitor; see process_competitor."""
         name = competitor.get('name', 'Unknown')
         url = competitor.get('url', '')
         
         result = {
             'competitor_name': name,
             'url': url,
-            'analysis_date': datetime.now().strftime('%Y-%m-%d'),
+            'analysis_date': today or datetime.now().strftime('%Y-%m-%d'),
             'is_strategic_shift': False,
             'findings': 'Processing...',
         }
@@ -99,7 +187,7 @@ class CompetitorMonitor:
                 return result
             
             # Extract text from URL
-            current_text = await self.browser.extract_text_from_url(url)
+            current_text = await self._fetch_text(url)
             
             if not current_text:
                 self.error_handler.log_network_error(
@@ -110,23 +198,27 @@ class CompetitorMonitor:
                 return result
             
             # Find historical report
-            historical_report = self.historical_retriever.find_latest_report()
-            
-            if historical_report:
-                historical_text = self.historical_retriever.get_baseline_text(
-                    historical_report
-                )
-                baseline_date = self.historical_retriever.get_report_date(
-                    historical_report
-                ).strftime('%Y-%m-%d') if historical_report else 'N/A'
-            else:
-                historical_text = None
-                baseline_date = 'N/A'
+            if baseline is None:
+                baseline = self.load_baseline()
+            historical_text, baseline_date = baseline
             
             # Perform semantic diffing
-            if historical_text:
-                diff_result = self.semantic_differ.diff_texts(
-                    current_text, historical_text
+            if historical_text and current_text == historical_text:
+                # Unchanged page: skip the embedding step entirely; classified
+                # like diff_texts' own identical-text result
+                result['similarity_percentage'] = 100.0
+                result['shift_classification'] = 'minor_update'
+                result['is_strategic_shift'] = False
+                result['baseline_date'] = baseline_date
+                result['detailed_changes'] = 'Similarity: 100.0%'
+                result['findings'] = 'No changes detected since the baseline.'
+            elif historical_text:
+                # Embedding is CPU-bound; run it in a worker thread so other
+                # competitors' page loads keep progressing meanwhile. The
+                # differ serializes its model calls, so concurrent diffs queue
+                # rather than share the tokenizer or oversubscribe the CPU
+                diff_result = await asyncio.to_thread(
+                    self.semantic_differ.diff_texts, current_text, historical_text
                 )
                 
                 result['similarity_percentage'] = diff_result['similarity_percentage']
@@ -169,13 +261,29 @@ class CompetitorMonitor:
         """
         Process a single competitor (synchronous wrapper).
         
+        Runs on one event loop kept for the lifetime of the monitor instead
+        of creating a new loop per call. Async callers should await
+        process_competitor directly; call close() when done.
+        
         Args:
             competitor: Competitor configuration
             
         Returns:
             Processing result dictionary
         """
-        return asyncio.run(self.process_competitor(competitor))
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(self.process_competitor(competitor))
+    
+    def close(self) -> None:
+        """Close the shared browser and the event loop used by process_competitor_sync."""
+        if self._loop is None:
+            return
+        try:
+            self._loop.run_until_complete(self.browser.close())
+        finally:
+            self._loop.close()
+            self._loop = None
     
     async def run_workflow(self) -> str:
         """
@@ -184,23 +292,54 @@ class CompetitorMonitor:
         Returns:
             Generated report content
         """
+        # Read the clock once so every date in this run agrees
+        now = datetime.now()
+        today = now.strftime('%Y-%m-%d')
+        
         # Load competitors configuration
         config = self.load_competitors_config()
         
         if not config:
-            return self._generate_error_report('Failed to load configuration')
+            return self._generate_error_report('Failed to load configuration', today)
         
         competitors = config.get('competitors', [])
         
         if not competitors:
-            return self._generate_error_report('No competitors configured')
+            return self._generate_error_report('No competitors configured', today)
+        
+        # The baseline is the same for every competitor; read it once
+        try:
+            baseline = self.load_baseline()
+        except Exception as e:
+            self.error_handler.log_script_error(f"Error loading baseline: {e}")
+            baseline = None
+        
+        # Process all competitors concurrently (bounded by the semaphore),
+        # sharing one browser between them
+        if self.browser.is_running:
+            outcomes = await self._gather_competitors(competitors, baseline, today)
+        else:
+            # Not inside ``async with``: launch the browser just for this run
+            async with self.browser:
+                outcomes = await self._gather_competitors(competitors, baseline, today)
         
-        # Process each competitor
         results = []
         errors = []
         
-        for competitor in competitors:
-            result = await self.process_competitor(competitor)
+        for competitor, result in zip(competitors, outcomes):
+            if isinstance(result, BaseException):
+                name = competitor.get('name', 'Unknown')
+                self.error_handler.log_script_error(
+                    f"Error processing {name}: {result}",
+                    name
+                )
+                result = {
+                    'competitor_name': name,
+                    'url': competitor.get('url', ''),
+                    'analysis_date': today,
+                    'is_strategic_shift': False,
+                    'findings': f'Error: {str(result)}',
+                }
             
             if result.get('findings', '').startswith('Error:'):
                 errors.append({
@@ -211,15 +350,15 @@ class CompetitorMonitor:
             results.append(result)
         
         # Generate report
-        report = self.report_generator.generate_report(results, errors)
+        report = self.report_generator.generate_report(results, errors, date=today)
         
         # Save report
-        filename = self.file_organizer.generate_filename()
+        filename = self.file_organizer.generate_filename(now)
         filepath = self.reports_dir / filename
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(report)
+            # Write off the event loop so a large report doesn't stall other tasks
+            await asyncio.to_thread(filepath.write_text, report, encoding='utf-8')
         except Exception as e:
             self.error_handler.log_report_error(
                 f"Failed to save report: {e}"
@@ -227,9 +366,44 @@ class CompetitorMonitor:
         
         return report
     
-    def _generate_error_report(self, error_message: str) -> str:
+    async def _fetch_text(self, url: str) -> Optional[str]:
+        """
+        Extract the text of a URL, fetching each URL only once per workflow run.
+        
+        Args:
+            url: The URL to extract
+            
+        Returns:
+            Extracted text content or None if extraction failed
+        """
+        if self._fetch_cache is None:
+            return await self.browser.extract_text_from_url(url)
+        
+        # Concurrent requests for the same URL await the same task
+        task = self._fetch_cache.get(url)
+        if task is None:
+            task = asyncio.create_task(self.browser.extract_text_from_url(url))
+            self._fetch_cache[url] = task
+        return await asyncio.shield(task)
+    
+    async def _gather_competitors(self, competitors: list[dict],
+                                  baseline: Optional[tuple[Optional[str], str]],
+                                  today: str) -> list:
+        """Run process_competitor for every competitor, returning exceptions as results."""
+        self._fetch_cache = {}
+        try:
+            return await asyncio.gather(
+                *(self.process_competitor(competitor, baseline, today) for competitor in competitors),
+                return_exceptions=True
+            )
+        finally:
+            self._fetch_cache = None
+    
+    def _generate_error_report(self, error_message: str, today: Optional[str] = None) -> str:
         """Generate an error report."""
-        return f'''# Intelligence Report: {datetime.now().strftime('%Y-%m-%d')}
+        if today is None:
+            today = datetime.now().strftime('%Y-%m-%d')
+        return f'''# Intelligence Report: {today}
 
 ## Error
 
@@ -251,8 +425,12 @@ def run_competitor_monitor(workspace_dir: str = '.') -> str:
     Returns:
         Generated report content
     """
-    monitor = CompetitorMonitor(workspace_dir)
-    return asyncio.run(monitor.run_workflow())
+    async def _run() -> str:
+        async with CompetitorMonitor(workspace_dir) as monitor:
+            return await monitor.run_workflow()
+    
+    use_uvloop()
+    return asyncio.run(_run())
 
 
 if __name__ == '__main__':
@@ -260,19 +438,19 @@ if __name__ == '__main__':
         print("Running Competitor Monitor Integration Test")
         print("=" * 40)
         
-        monitor = CompetitorMonitor('.')
-        
-        # Load config
-        config = monitor.load_competitors_config()
-        
-        if config:
-            print(f"\nLoaded {len(config.get('competitors', []))} competitors")
+        async with CompetitorMonitor('.') as monitor:
+            # Load config
+            config = monitor.load_competitors_config()
             
-            # Run full workflow
-            report = await monitor.run_workflow()
-            print(f"\nWorkflow completed")
-            print(f"Report saved to: {monitor.reports_dir / monitor.file_organizer.generate_filename()}")
-        else:
-            print("\nFailed to load configuration")
+            if config:
+                print(f"\nLoaded {len(config.get('competitors', []))} competitors")
+                
+                # Run full workflow
+                report = await monitor.run_workflow()
+                print(f"\nWorkflow completed")
+                print(f"Report saved to: {monitor.reports_dir / monitor.file_organizer.generate_filename()}")
+            else:
+                print("\nFailed to load configuration")
     
+    use_uvloop()
     asyncio.run(main())
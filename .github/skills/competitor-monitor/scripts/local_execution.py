@@ -4,13 +4,57 @@ Ensures all processing occurs locally on the host machine.
 Validates: Requirements 8.1, 8.2, 8.3, 8.4
 """
 
+import asyncio
+import json
 import os
 import socket
 import subprocess
+from dataclasses import dataclass, fields
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Maximum run time for a local script, in seconds
+SCRIPT_TIMEOUT = 300
+
+
+@dataclass(slots=True)
+class ExecutionLogEntry:
+    """A single execution log record; fields that don't apply are None."""
+    
+    timestamp: str
+    action: Optional[str] = None
+    execution_type: Optional[str] = None
+    # load_local_model
+    model: Optional[str] = None
+    path: Optional[str] = None
+    source: Optional[str] = None
+    # execute_local_script
+    script: Optional[str] = None
+    args: Optional[list[str]] = None
+    return_code: Optional[int] = None
+    stdout: Optional[str] = None
+    stderr: Optional[str] = None
+    error: Optional[str] = None
+    # log_data_access
+    data_type: Optional[str] = None
+    data_size: Optional[int] = None
+    destination: Optional[str] = None
+    
+    def to_dict(self) -> dict:
+        """Convert the entry to a dictionary of its set fields for serialization."""
+        return {
+            f.name: value
+            for f in fields(self)
+            if (value := getattr(self, f.name)) is not None
+        }
+
 
 class LocalExecutionGuarantee:
     """Ensures all processing occurs locally on the host machine."""
@@ -55,13 +99,13 @@ class LocalExecutionGuarantee:
         model_path = self.get_local_model_path(model_name)
         
         if model_path.exists():
-            self.execution_log.append({
-                'timestamp': datetime.now().isoformat(),
-                'action': 'load_local_model',
-                'model': model_name,
-                'path': str(model_path),
-                'source': 'local'
-            })
+            self.execution_log.append(ExecutionLogEntry(
+                timestamp=datetime.now().isoformat(),
+                action='load_local_model',
+                model=model_name,
+                path=str(model_path),
+                source='local'
+            ))
             return model_path
         
         return None
@@ -87,44 +131,85 @@ class LocalExecutionGuarantee:
                 cmd,
                 capture_output=True,
                 text=True,
-                timeout=300  # 5 minute timeout
+                timeout=SCRIPT_TIMEOUT
             )
             
-            self.execution_log.append({
-                'timestamp': datetime.now().isoformat(),
-                'action': 'execute_local_script',
-                'script': script_path,
-                'args': args or [],
-                'return_code': result.returncode,
-                'stdout': result.stdout,
-                'stderr': result.stderr,
-                'execution_type': 'local'
-            })
+            self._log_script_execution(
+                script_path, args,
+                return_code=result.returncode,
+                stdout=result.stdout,
+                stderr=result.stderr
+            )
             
             return result.returncode, result.stdout, result.stderr
             
         except subprocess.TimeoutExpired:
-            self.execution_log.append({
-                'timestamp': datetime.now().isoformat(),
-                'action': 'execute_local_script',
-                'script': script_path,
-                'args': args or [],
-                'error': 'timeout',
-                'execution_type': 'local'
-            })
+            self._log_script_execution(script_path, args, error='timeout')
             return -1, '', 'Script execution timed out'
         
         except Exception as e:
-            self.execution_log.append({
-                'timestamp': datetime.now().isoformat(),
-                'action': 'execute_local_script',
-                'script': script_path,
-                'args': args or [],
-                'error': str(e),
-                'execution_type': 'local'
-            })
+            self._log_script_execution(script_path, args, error=str(e))
+            return -1, '', str(e)
+    
+    async def execute_local_script_async(self, script_path: str,
+                                         args: Optional[list[str]] = None) -> tuple[int, str, str]:
+        """
+        Execute a local script without blocking the event loop.
+        
+        Several scripts can run concurrently by gathering this coroutine.
+        
+        Args:
+            script_path: Path to the script
+            args: Optional arguments
+            
+        Returns:
+            Tuple of (return_code, stdout, stderr)
+        """
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                'python', script_path, *(args or []),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            
+            try:
+                stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                    proc.communicate(), SCRIPT_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                self._log_script_execution(script_path, args, error='timeout')
+                return -1, '', 'Script execution timed out'
+            
+            stdout = stdout_bytes.decode()
+            stderr = stderr_bytes.decode()
+            
+            self._log_script_execution(
+                script_path, args,
+                return_code=proc.returncode,
+                stdout=stdout,
+                stderr=stderr
+            )
+            
+            return proc.returncode, stdout, stderr
+        
+        except Exception as e:
+            self._log_script_execution(script_path, args, error=str(e))
             return -1, '', str(e)
     
+    def _log_script_execution(self, script_path: str, args: Optional[list[str]],
+                              **details) -> None:
+        """Record a local script execution (result or error) in the execution log."""
+        self.execution_log.append(ExecutionLogEntry(
+            timestamp=datetime.now().isoformat(),
+            action='execute_local_script',
+            script=script_path,
+            args=args or [],
+            execution_type='local',
+            **details
+        ))
+    
     def check_no_network_access(self) -> bool:
         """
         Check if network access is disabled.
@@ -146,7 +231,7 @@ class LocalExecutionGuarantee:
     
     def log_data_access(self, data_type: str, 
                         data_size: int,
-                        destination: str = 'local') -> dict:
+                        destination: str = 'local') -> ExecutionLogEntry:
         """
         Log data access for audit purposes.
         
@@ -156,20 +241,20 @@ class LocalExecutionGuarantee:
             destination: Where data is being sent
             
         Returns:
-            Log entry dictionary
+            Log entry
         """
-        log_entry = {
-            'timestamp': datetime.now().isoformat(),
-            'data_type': data_type,
-            'data_size': data_size,
-            'destination': destination,
-            'execution_type': 'local' if destination == 'local' else 'external'
-        }
+        log_entry = ExecutionLogEntry(
+            timestamp=datetime.now().isoformat(),
+            data_type=data_type,
+            data_size=data_size,
+            destination=destination,
+            execution_type='local' if destination == 'local' else 'external'
+        )
         
         self.execution_log.append(log_entry)
         return log_entry
     
-    def get_execution_log(self) -> list[dict]:
+    def get_execution_log(self) -> list[ExecutionLogEntry]:
         """Get the execution log."""
         return self.execution_log
     
@@ -186,14 +271,14 @@ class LocalExecutionGuarantee:
         """
         external_executions = [
             e for e in self.execution_log 
-            if e.get('execution_type') == 'external'
+            if e.execution_type == 'external'
         ]
         
         return {
             'all_local': len(external_executions) == 0,
             'total_executions': len(self.execution_log),
             'external_executions': len(external_executions),
-            'external_details': external_executions
+            'external_details': [e.to_dict() for e in external_executions]
         }
 
 
@@ -213,13 +298,40 @@ def run_local_semantic_diff(current_file: str, historical_file: str,
     guarantee = LocalExecutionGuarantee()
     
     return_code, stdout, stderr = guarantee.execute_local_script(
-        script_path, [current_file, historical_file]
+        script_path, ['--compact', current_file, historical_file]
     )
     
+    return _parse_semantic_diff_output(return_code, stdout, stderr)
+
+
+async def run_local_semantic_diff_async(current_file: str, historical_file: str,
+                                        script_path: str = 'scripts/semantic_diff.py') -> dict:
+    """
+    Run semantic diffing locally without blocking the event loop.
+    
+    Args:
+        current_file: Path to current text file
+        historical_file: Path to historical text file
+        script_path: Path to the semantic diff script
+        
+    Returns:
+        Result dictionary
+    """
+    guarantee = LocalExecutionGuarantee()
+    
+    return_code, stdout, stderr = await guarantee.execute_local_script_async(
+        script_path, ['--compact', current_file, historical_file]
+    )
+    
+    return _parse_semantic_diff_output(return_code, stdout, stderr)
+
+
+def _parse_semantic_diff_output(return_code: int, stdout: str, stderr: str) -> dict:
+    """Build the semantic diff result dictionary from the script's output."""
     if return_code == 0:
-        import json
         try:
-            result = json.loads(stdout)
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            result = orjson.loads(stdout) if orjson is not None else json.loads(stdout)
             result['execution_type'] = 'local'
             return result
         except json.JSONDecodeError:
@@ -262,6 +374,6 @@ if __name__ == '__main__':
     # Show execution log
     print(f"\nExecution log:")
     for entry in guarantee.get_execution_log():
-        action = entry.get('action', 'N/A')
-        exec_type = entry.get('execution_type', 'N/A')
-        print(f"  {entry['timestamp']}: {action} - {exec_type}")
+        action = entry.action or 'N/A'
+        exec_type = entry.execution_type or 'N/A'
+        print(f"  {entry.timestamp}: {action} - {exec_type}")
@@ -4,10 +4,76 @@ Generates structured Markdown intelligence reports with strategic shift highligh
 Validates: Requirements 5.1, 5.2, 5.3, 5.4, 5.5
 """
 
+import asyncio
 import os
+from collections import ChainMap
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+
+
+# Per-competitor section, filled from the result dict with str.format_map
+_COMPETITOR_TMPL = '''## Competitor: {competitor_name}
+
+### Overview
+- **URL**: {url}
+- **Analysis Date**: {analysis_date}
+- **Similarity Score**: {similarity_percentage}%
+- **Classification**: {shift_classification}
+
+### Findings
+
+{findings}
+
+### Historical Comparison
+
+The current content was compared against the baseline from {baseline_date}. 
+The cosine similarity between embeddings is {similarity_percentage}%, 
+indicating a {shift_classification}.
+
+### Detailed Changes
+
+{detailed_changes}
+'''
+
+# Fallbacks for result keys missing from a competitor result
+_SECTION_DEFAULTS = {
+    'competitor_name': 'Unknown',
+    'url': 'N/A',
+    'analysis_date': 'N/A',
+    'similarity_percentage': 0,
+    'shift_classification': 'Unknown',
+    'findings': 'No significant findings.',
+    'baseline_date': 'N/A',
+    'detailed_changes': 'No detailed changes available.',
+}
+
+# Fixed report fragments, built once at import instead of per report
+_SHIFT_BLOCK = '''
+> **⚠️ STRATEGIC SHIFT DETECTED**
+> 
+> This competitor has made a significant change in their messaging that may indicate 
+> a change in business strategy, pricing model, or target demographic. 
+> Further analysis is recommended.
+'''
+
+_REC_TAIL = '''
+2. **Monitor Crunchbase**: Check Crunchbase profiles for recent funding rounds or team changes
+3. **Track Social Media**: Monitor Twitter/X for brand sentiment and customer feedback
+'''
+
+# Sections used when there are no errors / no strategic shifts
+_EMPTY_ERROR_SECTION = '''## Error Summary
+
+All competitors were processed successfully with no errors.
+'''
+
+_EMPTY_RECS_SECTION = '''## Recommendations
+
+Based on the analysis, consider the following actions:
+
+1. No immediate strategic shifts detected. Continue regular monitoring.
+''' + _REC_TAIL
 
 
 class ReportGenerator:
@@ -94,37 +160,44 @@ Based on the analysis, consider the following actions:
 3. **Track Social Media**: Monitor Twitter/X for brand sentiment and customer feedback
 '''
     
-    def generate_report(self, competitor_results: list[dict], errors: Optional[list[dict]] = None) -> str:
+    def generate_report(self, competitor_results: list[dict], errors: Optional[list[dict]] = None,
+                        date: Optional[str] = None) -> str:
         """
         Generate an intelligence report from competitor results.
         
         Args:
             competitor_results: List of competitor analysis results
             errors: List of error records
+            date: Report date (YYYY-MM-DD); defaults to the current date
             
         Returns:
             Generated Markdown report
         """
+        return ''.join(self.iter_report(competitor_results, errors, date))
+    
+    def iter_report(self, competitor_results: list[dict], errors: Optional[list[dict]] = None,
+                    date: Optional[str] = None) -> Iterator[str]:
+        """
+        Generate an intelligence report piece by piece.
+        
+        Lets callers stream the report to a file without holding the whole
+        document in memory.
+        
+        Args:
+            competitor_results: List of competitor analysis results
+            errors: List of error records
+            date: Report date (YYYY-MM-DD); defaults to the current date
+            
+        Yields:
+            Consecutive chunks of the Markdown report
+        """
         # Get current date
-        current_date = datetime.now().strftime('%Y-%m-%d')
+        current_date = date or datetime.now().strftime('%Y-%m-%d')
         
         # Count strategic shifts
         strategic_shifts = [r for r in competitor_results if r.get('is_strategic_shift', False)]
         
-        # Build competitor sections
-        competitor_sections = []
-        for result in competitor_results:
-            section = self._generate_competitor_section(result)
-            competitor_sections.append(section)
-        
-        # Build error section
-        error_section = self._generate_error_section(errors or [])
-        
-        # Build recommendations section
-        recommendations_section = self._generate_recommendations_section(strategic_shifts)
-        
-        # Combine all sections
-        report = f'''# Intelligence Report: {current_date}
+        yield f'''# Intelligence Report: {current_date}
 
 ## Executive Summary
 
@@ -134,68 +207,34 @@ and identification of strategic shifts.
 
 ---
 
-{''.join(competitor_sections)}
-
-{error_section}
-
-{recommendations_section}
 '''
         
-        return report
-    
-    def _generate_competitor_section(self, result: dict) -> str:
-        """Generate a section for a single competitor."""
-        name = result.get('competitor_name', 'Unknown')
-        url = result.get('url', 'N/A')
-        analysis_date = result.get('analysis_date', 'N/A')
-        similarity_percentage = result.get('similarity_percentage', 0)
-        classification = result.get('shift_classification', 'Unknown')
-        findings = result.get('findings', 'No significant findings.')
-        baseline_date = result.get('baseline_date', 'N/A')
-        detailed_changes = result.get('detailed_changes', 'No detailed changes available.')
-        has_strategic_shift = result.get('is_strategic_shift', False)
+        # Build competitor sections
+        for result in competitor_results:
+            yield from self._iter_competitor_section(result)
         
-        section = f'''## Competitor: {name}
-
-### Overview
-- **URL**: {url}
-- **Analysis Date**: {analysis_date}
-- **Similarity Score**: {similarity_percentage}%
-- **Classification**: {classification}
-
-### Findings
-
-{findings}
-
-### Historical Comparison
-
-The current content was compared against the baseline from {baseline_date}. 
-The cosine similarity between embeddings is {similarity_percentage}%, 
-indicating a {classification}.
-
-### Detailed Changes
-
-{detailed_changes}
-'''
+        # Build error section
+        yield '\n\n'
+        yield self._generate_error_section(errors or [])
         
-        if has_strategic_shift:
-            section += '''
-> **⚠️ STRATEGIC SHIFT DETECTED**
-> 
-> This competitor has made a significant change in their messaging that may indicate 
-> a change in business strategy, pricing model, or target demographic. 
-> Further analysis is recommended.
-'''
+        # Build recommendations section
+        yield '\n\n'
+        yield from self._iter_recommendations_section(strategic_shifts)
+        yield '\n'
+    
+    def _iter_competitor_section(self, result: dict) -> Iterator[str]:
+        """Generate the section for a single competitor."""
+        yield _COMPETITOR_TMPL.format_map(ChainMap(result, _SECTION_DEFAULTS))
+        
+        if result.get('is_strategic_shift', False):
+            yield _SHIFT_BLOCK
         
-        return section + '\n'
+        yield '\n'
     
     def _generate_error_section(self, errors: list[dict]) -> str:
         """Generate the error summary section."""
         if not errors:
-            return '''## Error Summary
-
-All competitors were processed successfully with no errors.
-'''
+            return _EMPTY_ERROR_SECTION
         
         error_lines = ['## Error Summary\n\nThe following errors occurred during processing:\n']
         for error in errors:
@@ -205,29 +244,19 @@ All competitors were processed successfully with no errors.
         
         return '\n'.join(error_lines) + '\n'
     
-    def _generate_recommendations_section(self, strategic_shifts: list[dict]) -> str:
+    def _iter_recommendations_section(self, strategic_shifts: list[dict]) -> Iterator[str]:
         """Generate the recommendations section."""
         if strategic_shifts:
-            shift_lines = ['## Recommendations\n\nBased on the analysis, consider the following actions:\n\n1. **Review Strategic Shifts**: The following competitors have detected strategic shifts that may require immediate attention:\n']
+            yield '## Recommendations\n\nBased on the analysis, consider the following actions:\n\n1. **Review Strategic Shifts**: The following competitors have detected strategic shifts that may require immediate attention:\n'
             for shift in strategic_shifts:
                 name = shift.get('competitor_name', 'Unknown')
                 shift_details = shift.get('shift_details', 'No details available')
-                shift_lines.append(f'   - {name}: {shift_details}')
+                yield f'\n   - {name}: {shift_details}'
             
-            return '\n'.join(shift_lines) + '''
-2. **Monitor Crunchbase**: Check Crunchbase profiles for recent funding rounds or team changes
-3. **Track Social Media**: Monitor Twitter/X for brand sentiment and customer feedback
-'''
+            yield _REC_TAIL
+            return
         
-        return '''## Recommendations
-
-Based on the analysis, consider the following actions:
-
-1. No immediate strategic shifts detected. Continue regular monitoring.
-
-2. **Monitor Crunchbase**: Check Crunchbase profiles for recent funding rounds or team changes
-3. **Track Social Media**: Monitor Twitter/X for brand sentiment and customer feedback
-'''
+        yield _EMPTY_RECS_SECTION
     
     def save_report(self, report: str, output_path: str) -> bool:
         """
@@ -253,6 +282,49 @@ Based on the analysis, consider the following actions:
         except Exception as e:
             print(f"Error saving report: {e}")
             return False
+    
+    def write_report(self, competitor_results: list[dict], output_path: str,
+                     errors: Optional[list[dict]] = None,
+                     date: Optional[str] = None) -> bool:
+        """
+        Generate a report and stream it straight to a file.
+        
+        Args:
+            competitor_results: List of competitor analysis results
+            output_path: Path to save the report
+            errors: List of error records
+            date: Report date (YYYY-MM-DD); defaults to the current date
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            # Create output directory if it doesn't exist
+            output_dir = os.path.dirname(output_path)
+            if output_dir and not os.path.exists(output_dir):
+                os.makedirs(output_dir)
+            
+            with open(output_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                for chunk in self.iter_report(competitor_results, errors, date):
+                    f.write(chunk)
+            
+            return True
+        except Exception as e:
+            print(f"Error saving report: {e}")
+            return False
+    
+    async def save_report_async(self, report: str, output_path: str) -> bool:
+        """
+        Save a report to a file without blocking the event loop.
+        
+        Args:
+            report: The report content to save
+            output_path: Path to save the report
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        return await asyncio.to_thread(self.save_report, report, output_path)
 
 
 def generate_intelligence_report(competitor_results: list[dict], errors: Optional[list[dict]] = None) -> str:
@@ -4,33 +4,236 @@ Uses sentence-transformers to calculate cosine similarity between text embedding
 Validates: Requirements 4.1, 4.2, 4.5
 """
 
+import argparse
+import hashlib
 import json
+import mmap
+import os
+import platform
+import stat
 import sys
+import threading
+from collections import OrderedDict
+from contextlib import nullcontext
+from functools import partial
+from pathlib import Path
 from typing import Optional
 
+# Let the encoder's GEMMs use every core available to this process unless
+# the caller chose otherwise. torch sizes its thread pool from these at
+# import time, so they must be set before sentence_transformers loads.
+_NUM_THREADS = str(
+    len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count() or 1
+)
+os.environ.setdefault('OMP_NUM_THREADS', _NUM_THREADS)
+os.environ.setdefault('MKL_NUM_THREADS', _NUM_THREADS)
+
 try:
+    import numpy as np
     from sentence_transformers import SentenceTransformer
-    from sklearn.metrics.pairwise import cosine_similarity
 except ImportError as e:
     print(json.dumps({"error": f"Missing dependency: {e}"}))
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Where converted models (e.g. the quantized ONNX export) are cached
+MODEL_CACHE_DIR = Path(os.environ.get('SEMDIFF_CACHE_DIR', 'models'))
+
+# Token step between the starts of consecutive windows of a long text;
+# windows overlap when it is below the model's max sequence length
+CHUNK_STRIDE = 200
+
+# Static-embedding model distilled from all-MiniLM-L6-v2, used by the model2vec backend
+MODEL2VEC_MODEL = 'minishlab/potion-base-8M'
+
+
+def _load_onnx_int8_model(model_name: str) -> SentenceTransformer:
+    """
+    Load an int8 dynamically quantized ONNX version of a model.
+    
+    The model is exported and quantized on first use and cached under
+    MODEL_CACHE_DIR; later runs load the cached file directly.
+    
+    Args:
+        model_name: Name of the sentence-transformers model to use
+        
+    Returns:
+        SentenceTransformer running on ONNX Runtime
+    """
+    config = 'arm64' if platform.machine().lower() in ('arm64', 'aarch64') else 'avx2'
+    model_dir = MODEL_CACHE_DIR / f"{model_name.replace('/', '_')}-onnx"
+    file_name = f'onnx/model_qint8_{config}.onnx'
+    
+    if not (model_dir / file_name).exists():
+        # Needs sentence-transformers >= 3.2 with the onnx extra
+        from sentence_transformers import export_dynamic_quantized_onnx_model
+        
+        model = SentenceTransformer(model_name, backend='onnx')
+        model.save(str(model_dir))
+        export_dynamic_quantized_onnx_model(model, config, str(model_dir))
+    
+    return SentenceTransformer(str(model_dir), backend='onnx', model_kwargs={'file_name': file_name})
+
+
+def _load_tensorrt_model(model_name: str) -> SentenceTransformer:
+    """
+    Load an ONNX version of a model running on ONNX Runtime's TensorRT provider.
+    
+    The ONNX export is made on first use and cached under MODEL_CACHE_DIR,
+    next to the built FP16 TensorRT engines so later runs skip the
+    (slow) engine build. Needs an NVIDIA GPU and onnxruntime-gpu with
+    TensorRT support.
+    
+    Args:
+        model_name: Name of the sentence-transformers model to use
+        
+    Returns:
+        SentenceTransformer running on TensorRT
+    """
+    model_dir = MODEL_CACHE_DIR / f"{model_name.replace('/', '_')}-onnx"
+    
+    if not (model_dir / 'onnx' / 'model.onnx').exists():
+        SentenceTransformer(model_name, backend='onnx').save(str(model_dir))
+    
+    return SentenceTransformer(str(model_dir), backend='onnx', model_kwargs={
+        'provider': 'TensorrtExecutionProvider',
+        'provider_options': {
+            'trt_fp16_enable': True,
+            'trt_engine_cache_enable': True,
+            'trt_engine_cache_path': str(model_dir / 'trt_engines'),
+        },
+    })
+
+
+def _load_model2vec_model(model_name: str):
+    """
+    Load a Model2Vec static-embedding model.
+    
+    Model2Vec replaces the transformer forward pass with a token embedding
+    lookup and mean, trading a little quality for a large CPU speedup.
+    
+    Args:
+        model_name: Name of the Model2Vec model to use
+        
+    Returns:
+        model2vec StaticModel
+    """
+    from model2vec import StaticModel
+    
+    return StaticModel.from_pretrained(model_name)
+
+
+def _select_device() -> str:
+    """
+    Pick the fastest available torch device.
+    
+    Returns:
+        'cuda' if a CUDA GPU is available, else 'mps' on Apple silicon, else 'cpu'
+    """
+    import torch
+    
+    if torch.cuda.is_available():
+        return 'cuda'
+    if torch.backends.mps.is_available():
+        return 'mps'
+    return 'cpu'
+
+
+def _quantize_int8(embedding: np.ndarray) -> tuple[list[int], float]:
+    """
+    Symmetrically quantize an embedding to int8.
+    
+    Args:
+        embedding: Float embedding vector
+        
+    Returns:
+        Tuple of (int8 values, scale); values * scale approximates the embedding
+    """
+    scale = float(np.abs(embedding).max()) / 127 or 1.0
+    return np.round(embedding / scale).astype(np.int8).tolist(), scale
+
 
 class SemanticDiffer:
     """Performs semantic diffing using sentence embeddings."""
     
-    def __init__(self, model_name: str = 'all-MiniLM-L6-v2'):
+    def __init__(self, model_name: str = 'all-MiniLM-L6-v2', backend: Optional[str] = None,
+                 cache_size: int = 10000, dtype: Optional[str] = None,
+                 quantize_embeddings: bool = False, device: Optional[str] = None):
         """
         Initialize the semantic differ.
         
         Args:
             model_name: Name of the sentence-transformers model to use
+            backend: 'torch' (FP32, default), 'onnx-int8', 'tensorrt' or 'model2vec';
+                defaults to the SEMDIFF_BACKEND environment variable. The
+                model2vec backend loads MODEL2VEC_MODEL in place of the
+                default model
+            cache_size: Maximum number of text embeddings kept in memory
+            dtype: Torch weight precision, 'fp32' (default), 'fp16' (CUDA only)
+                or 'bf16'; defaults to the SEMDIFF_DTYPE environment variable
+            quantize_embeddings: Emit included embeddings as int8 values plus
+                a scale factor instead of floats (about 4x smaller JSON)
+            device: Torch device for the torch backend ('cuda', 'mps', 'cpu');
+                defaults to the SEMDIFF_DEVICE environment variable, else the
+                fastest available device
         """
-        self.model = SentenceTransformer(model_name)
+        self.backend = backend or os.environ.get('SEMDIFF_BACKEND', 'torch')
+        self.dtype = dtype or os.environ.get('SEMDIFF_DTYPE', 'fp32')
+        self.quantize_embeddings = quantize_embeddings
+        # Normalized embeddings keyed by blake2b digest of the text, in LRU order
+        self.cache_size = cache_size
+        self._embedding_cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        # Serializes the cache and the model: the tokenizer is not safe to
+        # share between threads, and each encode already uses every core
+        self._lock = threading.Lock()
+        
+        if self.backend == 'onnx-int8':
+            self.model = _load_onnx_int8_model(model_name)
+        elif self.backend == 'tensorrt':
+            self.model = _load_tensorrt_model(model_name)
+        elif self.backend == 'model2vec':
+            if model_name == 'all-MiniLM-L6-v2':
+                model_name = MODEL2VEC_MODEL
+            self.model = _load_model2vec_model(model_name)
+        elif self.backend == 'torch':
+            device = device or os.environ.get('SEMDIFF_DEVICE') or _select_device()
+            self.model = SentenceTransformer(model_name, device=device)
+        else:
+            raise ValueError(f"Unknown backend: {self.backend}")
+        
+        # Entered around every encode call; bf16 swaps in torch autocast
+        self._autocast = nullcontext
+        if self.dtype != 'fp32':
+            self._set_half_precision()
+    
+    def _set_half_precision(self):
+        """Cast the torch model to FP16 (GPU) or BF16 weights for faster inference."""
+        if self.dtype not in ('fp16', 'bf16'):
+            raise ValueError(f"Unknown dtype: {self.dtype}")
+        if self.backend != 'torch':
+            raise ValueError(f"dtype {self.dtype} requires the torch backend")
+        
+        import torch
+        
+        if self.dtype == 'fp16':
+            # FP16 matmuls are only fast (and fully supported) on CUDA
+            if self.model.device.type != 'cuda':
+                raise ValueError("dtype fp16 requires a CUDA device; use bf16 on CPU")
+            self.model = self.model.half()
+        else:
+            self.model = self.model.to(dtype=torch.bfloat16)
+            self._autocast = partial(
+                torch.autocast, self.model.device.type, dtype=torch.bfloat16
+            )
     
     def embed_text(self, text: str) -> list[float]:
         """
-        Embed a text string into a vector.
+        Embed a text string into a unit-length vector.
         
         Args:
             text: Text to embed
@@ -38,80 +241,427 @@ class SemanticDiffer:
         Returns:
             List of embedding values
         """
-        embedding = self.model.encode([text])[0]
-        return embedding.tolist()
+        return self._embed([text])[0].tolist()
+    
+    def _embed(self, texts: list[str]) -> np.ndarray:
+        """
+        Embed texts as unit vectors, reusing cached embeddings of repeated texts.
+        
+        Only texts not seen recently go through the model, in a single
+        encode call. Safe to call from several threads; model calls are
+        serialized. Texts longer than the model's max sequence length are
+        embedded as the renormalized mean of their overlapping windows
+        instead of being truncated.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Array with one normalized embedding per text, in order
+        """
+        keys = [hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest() for text in texts]
+        
+        with self._lock:
+            # Hits are copied out before misses are inserted, since eviction
+            # may drop them when one call has more texts than the cache holds
+            found = {}
+            missing = {}
+            for key, text in zip(keys, texts):
+                if key in found or key in missing:
+                    continue
+                if key in self._embedding_cache:
+                    self._embedding_cache.move_to_end(key)
+                    found[key] = self._embedding_cache[key]
+                else:
+                    missing[key] = text
+            
+            if missing:
+                encoded = dict(zip(missing, self._encode(list(missing.values()))))
+                found.update(encoded)
+                self._embedding_cache.update(encoded)
+                while len(self._embedding_cache) > self.cache_size:
+                    self._embedding_cache.popitem(last=False)
+        
+        return np.stack([found[key] for key in keys])
+    
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        """
+        Run texts through the model, bypassing the embedding cache.
+        
+        This is the only place the model is called; everything else reaches
+        it through _embed, so no text is encoded twice while it is cached.
+        
+        Args:
+            texts: Texts to encode
+            
+        Returns:
+            Array with one normalized embedding per text, in order
+        """
+        if self.backend == 'model2vec':
+            # max_length=None averages over every token instead of the
+            # first 512, so long pages keep their tail
+            encoded = self.model.encode(texts, batch_size=64, max_length=None)
+            # StaticModel.encode has no normalize option; an empty text embeds
+            # as the zero vector, which is left as is rather than turned to NaN
+            norms = np.linalg.norm(encoded, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            return encoded / norms
+        return self._encode_chunked(texts)
+    
+    def _encode_chunked(self, texts: list[str]) -> np.ndarray:
+        """
+        Encode texts with the transformer, covering long texts window by window.
+        
+        All windows of all texts go through one encode call; each text's
+        window embeddings are then summed and renormalized.
+        
+        Args:
+            texts: Texts to encode
+            
+        Returns:
+            Array with one normalized embedding per text, in order
+        """
+        window = self.model.max_seq_length - 2  # room for [CLS] and [SEP]
+        step = min(CHUNK_STRIDE, window)
+        token_ids = self.model.tokenizer(texts, add_special_tokens=False, verbose=False)['input_ids']
+        
+        chunks = []
+        starts = []
+        for text, ids in zip(texts, token_ids):
+            starts.append(len(chunks))
+            if len(ids) <= window:
+                chunks.append(text)
+                continue
+            for start in range(0, len(ids), step):
+                chunks.append(self.model.tokenizer.decode(ids[start:start + window]))
+                if start + window >= len(ids):
+                    break
+        
+        # encode() sorts its inputs by length before batching (and restores
+        # the order), so each batch pads only to similar lengths
+        with self._autocast():
+            encoded = self.model.encode(
+                chunks, batch_size=64,
+                normalize_embeddings=True, convert_to_numpy=True
+            )
+        
+        if len(chunks) == len(texts):
+            return encoded
+        
+        # The mean of a text's window embeddings points the same way as their sum
+        pooled = np.add.reduceat(encoded, starts, axis=0)
+        return pooled / np.linalg.norm(pooled, axis=1, keepdims=True)
     
-    def calculate_similarity(self, text1: str, text2: str) -> dict:
+    def calculate_similarity(self, text1: str, text2: str,
+                             include_embeddings: bool = False) -> dict:
         """
         Calculate cosine similarity between two texts.
         
         Args:
             text1: First text
             text2: Second text
+            include_embeddings: Whether to add both embeddings to the result
             
         Returns:
-            Dictionary with similarity percentage and embeddings
+            Dictionary with similarity percentage (and embeddings if requested)
         """
-        # Embed both texts
-        embeddings = self.model.encode([text1, text2])
+        # Embed both texts as unit vectors
+        embeddings = self._embed([text1, text2])
         
-        # Calculate cosine similarity
-        similarity = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
+        # Cosine similarity of unit vectors is their dot product
+        similarity = float(embeddings[0] @ embeddings[1])
         
-        # Convert to percentage (0-100)
-        similarity_percentage = ((similarity + 1) / 2) * 100
+        if include_embeddings:
+            return self._build_result(similarity, embeddings[0], embeddings[1])
+        return self._build_result(similarity)
+    
+    def _build_result(self, similarity: float, embedding1: Optional[np.ndarray] = None,
+                      embedding2: Optional[np.ndarray] = None) -> dict:
+        """
+        Build the diff result dictionary for one pair of texts.
         
-        # Classify based on threshold (0.80 = 80%)
+        Args:
+            similarity: Cosine similarity between the two texts
+            embedding1: Embedding of the first text, added to the result if given
+            embedding2: Embedding of the second text, added to the result if given
+            
+        Returns:
+            Dictionary with similarity percentage (and embeddings if given)
+        """
+        # Classify on the raw cosine (0.80 = 80%)
         threshold = 0.80
         is_strategic_shift = similarity < threshold
         
-        return {
-            "similarity_percentage": round(float(similarity_percentage), 2),
-            "cosine_similarity": round(float(similarity), 4),
-            "threshold": float(threshold),
-            "shift_classification": "Strategic_Shift" if bool(is_strategic_shift) else "minor_update",
-            "is_strategic_shift": bool(is_strategic_shift),
-            "text1_embedding": [float(x) for x in embeddings[0].tolist()],
-            "text2_embedding": [float(x) for x in embeddings[1].tolist()],
+        # similarity is already a Python float, so no numpy scalar conversions;
+        # (similarity + 1) * 50 maps [-1, 1] to a 0-100 display percentage
+        result = {
+            "similarity_percentage": round((similarity + 1) * 50, 2),
+            "cosine_similarity": round(similarity, 4),
+            "threshold": threshold,
+            "shift_classification": "Strategic_Shift" if is_strategic_shift else "minor_update",
+            "is_strategic_shift": is_strategic_shift,
         }
+        
+        if embedding1 is None or embedding2 is None:
+            return result
+        
+        if self.quantize_embeddings:
+            result["text1_embedding_int8"], result["text1_embedding_scale"] = _quantize_int8(embedding1)
+            result["text2_embedding_int8"], result["text2_embedding_scale"] = _quantize_int8(embedding2)
+        else:
+            # tolist() already yields Python floats
+            result["text1_embedding"] = embedding1.tolist()
+            result["text2_embedding"] = embedding2.tolist()
+        
+        return result
     
-    def diff_texts(self, current_text: str, historical_text: str) -> dict:
+    def diff_texts(self, current_text: str, historical_text: str,
+                   include_embeddings: bool = False) -> dict:
         """
         Perform semantic diffing between current and historical text.
         
         Args:
             current_text: Current text content
             historical_text: Historical text content
+            include_embeddings: Whether to add both embeddings to the result
+            
+        Returns:
+            Dictionary with diff results
+        """
+        if current_text == historical_text:
+            # Unchanged page (the common case): no model call unless the
+            # embedding itself was asked for
+            if not include_embeddings:
+                return self._build_result(1.0)
+            embedding = self._embed([current_text])[0]
+            return self._build_result(1.0, embedding, embedding)
+        
+        return self.calculate_similarity(current_text, historical_text, include_embeddings)
+    
+    def diff_embedding(self, current_text: str, historical_embedding: np.ndarray,
+                       include_embeddings: bool = False) -> dict:
+        """
+        Diff current text against a previously saved historical embedding.
+        
+        Only the current text is encoded. The embedding must come from the
+        same model and backend (see save_embedding).
+        
+        Args:
+            current_text: Current text content
+            historical_embedding: Normalized embedding of the historical text
+            include_embeddings: Whether to add both embeddings to the result
             
         Returns:
             Dictionary with diff results
         """
-        return self.calculate_similarity(current_text, historical_text)
+        embedding = self._embed([current_text])[0]
+        if historical_embedding.shape != embedding.shape:
+            raise ValueError(
+                f"Historical embedding has shape {historical_embedding.shape}, "
+                f"expected {embedding.shape}; was it saved with another model?"
+            )
+        
+        similarity = float(embedding @ historical_embedding)
+        
+        if include_embeddings:
+            return self._build_result(similarity, embedding, historical_embedding)
+        return self._build_result(similarity)
+    
+    def save_embedding(self, text: str, path: str):
+        """
+        Save the normalized embedding of a text as a .npy file.
+        
+        The next run can pass the file as the historical side of a diff so
+        the historical text is not encoded again.
+        
+        Args:
+            text: Text to embed
+            path: Output path (numpy appends .npy if missing)
+        """
+        np.save(path, self._embed([text])[0])
+    
+    def diff_batch(self, pairs: list[tuple[str, str]],
+                   include_embeddings: bool = False) -> list[dict]:
+        """
+        Diff several (current, historical) text pairs with one encode call.
+        
+        Encoding all texts together lets the model run full batches instead
+        of one batch of two per pair.
+        
+        Args:
+            pairs: List of (current_text, historical_text) tuples
+            include_embeddings: Whether to add both embeddings to each result
+            
+        Returns:
+            Diff result dictionary for each pair, in order
+        """
+        if not pairs:
+            return []
+        
+        flat = [text for pair in pairs for text in pair]
+        embeddings = self._embed(flat)
+        
+        # Row-wise dot products of each (current, historical) pair
+        current, historical = embeddings[0::2], embeddings[1::2]
+        # tolist() converts every similarity to a Python float in one pass
+        similarities = (current * historical).sum(axis=1).tolist()
+        
+        if not include_embeddings:
+            return [self._build_result(similarity) for similarity in similarities]
+        
+        return [
+            self._build_result(similarity, current[i], historical[i])
+            for i, similarity in enumerate(similarities)
+        ]
+
+
+def _dumps(obj: dict, indent: bool = False) -> str:
+    """
+    Serialize a result to JSON, with orjson when it is installed.
+    
+    Args:
+        obj: Object to serialize
+        indent: Whether to pretty-print with a two-space indent; otherwise
+            the output has no whitespace at all
+        
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode()
+    if indent:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def _read_text(path: str) -> str:
+    """
+    Read a UTF-8 text file.
+    
+    Regular files are memory-mapped and decoded straight from the page
+    cache, so no intermediate bytes copy of a large file is held alongside
+    the decoded text. Pipes, process substitution and procfs report a
+    size of 0 and are read normally.
+    
+    Args:
+        path: Path to the text file
+        
+    Returns:
+        File content with universal newlines, like text-mode open()
+    """
+    with open(path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        if not (stat.S_ISREG(st.st_mode) and st.st_size > 0):
+            # mmap cannot map empty or non-regular files
+            with open(f.fileno(), 'r', encoding='utf-8', closefd=False) as text_file:
+                return text_file.read()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, 'utf-8')
+    
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _diff_files(differ: SemanticDiffer, current_text: str, historical_file: str,
+                include_embeddings: bool) -> dict:
+    """Diff current text against a historical text file or saved .npy embedding."""
+    if historical_file.endswith('.npy'):
+        return differ.diff_embedding(current_text, np.load(historical_file), include_embeddings)
+    return differ.diff_texts(current_text, _read_text(historical_file), include_embeddings)
+
+
+def main_server(include_embeddings: bool = False, quantize_embeddings: bool = False):
+    """
+    Serve diff requests from stdin with the model kept loaded.
+    
+    Each input line holds a tab-separated pair of file paths
+    (current, historical text or .npy embedding); one compact JSON result
+    is written per line.
+    Avoids paying the model load for every pair.
+    
+    Args:
+        include_embeddings: Whether to add both embeddings to each result
+        quantize_embeddings: Whether to emit those embeddings as int8
+    """
+    differ = SemanticDiffer(quantize_embeddings=quantize_embeddings)
+    
+    for line in sys.stdin:
+        line = line.rstrip('\n')
+        if not line:
+            continue
+        
+        paths = line.split('\t')
+        if len(paths) != 2:
+            print(json.dumps({"error": "Expected two tab-separated file paths"}), flush=True)
+            continue
+        
+        try:
+            result = _diff_files(differ, _read_text(paths[0]), paths[1], include_embeddings)
+        except FileNotFoundError as e:
+            result = {"error": f"File not found: {e}"}
+        except Exception as e:
+            result = {"error": f"Error during diffing: {e}"}
+        
+        print(_dumps(result), flush=True)
+
+
+_USAGE = (
+    "Usage: python semantic_diff.py [--compact | --with-embeddings | --int8-embeddings] "
+    "[--save-embedding <npy_file>] <current_text_file> "
+    "<historical_text_file | historical_embedding.npy> | --server"
+)
+
+
+class _ArgumentParser(argparse.ArgumentParser):
+    """Argument parser that reports usage errors as JSON, like the rest of the CLI."""
+    
+    def error(self, message: str):
+        print(json.dumps({"error": _USAGE}))
+        sys.exit(1)
 
 
 def main():
     """Main entry point for the semantic diffing CLI."""
-    if len(sys.argv) != 3:
-        print(json.dumps({"error": "Usage: python semantic_diff.py <current_text_file> <historical_text_file>"}))
-        sys.exit(1)
+    parser = _ArgumentParser(add_help=False)
+    parser.add_argument('files', nargs='*')
+    parser.add_argument('--server', action='store_true')
+    parser.add_argument('--with-embeddings', action='store_true')
+    parser.add_argument('--int8-embeddings', action='store_true')
+    parser.add_argument('--save-embedding')
+    parser.add_argument('--compact', action='store_true')
+    args = parser.parse_args()
+    include_embeddings = args.with_embeddings or args.int8_embeddings
     
-    current_file = sys.argv[1]
-    historical_file = sys.argv[2]
+    if args.server:
+        if args.files or args.save_embedding:
+            parser.error('--server takes no file arguments')
+        main_server(include_embeddings, args.int8_embeddings)
+        return
+    
+    if len(args.files) != 2:
+        parser.error('expected two files')
+    if args.compact and include_embeddings:
+        parser.error('--compact output never includes embeddings')
+    
+    current_file, historical_file = args.files
     
     try:
-        # Read text files
-        with open(current_file, 'r', encoding='utf-8') as f:
-            current_text = f.read()
-        
-        with open(historical_file, 'r', encoding='utf-8') as f:
-            historical_text = f.read()
+        # Read the current text file
+        current_text = _read_text(current_file)
         
         # Perform semantic diffing
-        differ = SemanticDiffer()
-        result = differ.diff_texts(current_text, historical_text)
+        differ = SemanticDiffer(quantize_embeddings=args.int8_embeddings)
+        result = _diff_files(differ, current_text, historical_file, include_embeddings)
+        
+        # Keep the current embedding as the next run's baseline
+        if args.save_embedding:
+            differ.save_embedding(current_text, args.save_embedding)
         
         # Output JSON result
-        print(json.dumps(result, indent=2))
+        # Pipelines pass --compact: one whitespace-free line per diff
+        print(_dumps(result, indent=not args.compact))
         
     except FileNotFoundError as e:
         print(json.dumps({"error": f"File not found: {e}"}))